@@ -13,6 +13,7 @@ from artcommonlib.github_auth import get_github_git_auth_env
 from artcommonlib.logutil import get_logger
 from artcommonlib.pushd import Dir
 from artcommonlib.util import ensure_github_https_url
+from artcommonlib.yaml_util import FullLoader
 from future.utils import as_native_str
 
 SCHEMES = ['ssh', 'ssh+git', "http", "https"]
@@ -242,7 +243,7 @@ class GitData(object):
             raw_text = f.read()
 
         try:
-            data = yaml.full_load(raw_text)
+            data = yaml.load(raw_text, Loader=FullLoader)
         except Exception as e:
             raise ValueError(f"error parsing file {full_path}: {e}")
 
@@ -297,7 +298,7 @@ class GitData(object):
                                     'Error applying template substitution to {}: {}'.format(data_file, e)
                                 )
                         try:
-                            data = yaml.full_load(raw_text)
+                            data = yaml.load(raw_text, Loader=FullLoader)
                         except Exception as e:
                             raise ValueError(f"error parsing file {data_file}: {e}")
                         use = True
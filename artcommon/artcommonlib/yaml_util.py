@@ -0,0 +1,20 @@
+"""
+PyYAML loader and dumper classes. The libyaml-backed implementations are used when PyYAML was built
+with them; otherwise the pure-Python ones are. Both produce the same results.
+
+Usage::
+
+    import yaml
+    from artcommonlib.yaml_util import SafeLoader
+
+    data = yaml.load(content, Loader=SafeLoader)
+"""
+
+try:
+    from yaml import CFullLoader as FullLoader
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import FullLoader, SafeDumper, SafeLoader
+
+__all__ = ['FullLoader', 'SafeDumper', 'SafeLoader']
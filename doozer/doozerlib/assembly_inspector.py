@@ -328,56 +328,55 @@ class AssemblyInspector:
         self.runtime.logger.info(f'Checking group RPM for consistency: {rpm_meta.distgit_key}...')
         issues: List[AssemblyIssue] = []
 
-        for rpm_meta in self.runtime.rpm_metas():
-            dgk = rpm_meta.distgit_key
-            for el_ver in rpm_meta.determine_rhel_targets():
-                brew_build_dict = self.get_group_rpm_build_dicts(el_ver=el_ver)[dgk]
-                if not brew_build_dict:
-                    # Impermissible. The RPM should be built for each target.
-                    issues.append(AssemblyIssue(f'Did not find rhel-{el_ver} build for {dgk}', component=dgk))
-                    continue
+        dgk = rpm_meta.distgit_key
+        for el_ver in rpm_meta.determine_rhel_targets():
+            brew_build_dict = self.get_group_rpm_build_dicts(el_ver=el_ver)[dgk]
+            if not brew_build_dict:
+                # Impermissible. The RPM should be built for each target.
+                issues.append(AssemblyIssue(f'Did not find rhel-{el_ver} build for {dgk}', component=dgk))
+                continue
 
-                """
-                Assess whether the image build has the upstream
-                source git repo and git commit that may have been declared/
-                overridden in an assembly definition.
-                """
-                content_git_url = rpm_meta.config.content.source.git.url
-                if content_git_url:
-                    # Make sure things are in https form so we can compare
-                    # content_git_url = util.convert_remote_git_to_https(content_git_url)
-
-                    # TODO: The commit in which this comment is introduced also introduces
-                    # machine parsable yaml documents into distgit commits. Once this code
-                    # has been running for our active 4.x releases for some time,
-                    # we should check the distgit commit info against the git.url
-                    # in our metadata.
-
-                    try:
-                        target_branch = rpm_meta.config.content.source.git.branch.target
-                        if target_branch:
-                            _ = int(target_branch, 16)  # parse the name as a git commit
-                            # if we reach here, a git commit hash was declared as the
-                            # upstream source of the rpm package's content. We should verify
-                            # it perfectly matches what we find in the assembly build.
-                            # Each package build gets git commits encoded into the
-                            # release field of the NVR. So the NVR should contain
-                            # the desired commit.
-                            build_nvr = brew_build_dict['nvr']
-                            if target_branch[:7] not in build_nvr:
-                                # Impermissible because the assembly definition can simply be changed.
-                                issues.append(
-                                    AssemblyIssue(
-                                        f'{dgk} build for rhel-{el_ver} did not find git commit {target_branch[:7]} in package RPM NVR {build_nvr}',
-                                        component=dgk,
-                                    )
+            """
+            Assess whether the image build has the upstream
+            source git repo and git commit that may have been declared/
+            overridden in an assembly definition.
+            """
+            content_git_url = rpm_meta.config.content.source.git.url
+            if content_git_url:
+                # Make sure things are in https form so we can compare
+                # content_git_url = util.convert_remote_git_to_https(content_git_url)
+
+                # TODO: The commit in which this comment is introduced also introduces
+                # machine parsable yaml documents into distgit commits. Once this code
+                # has been running for our active 4.x releases for some time,
+                # we should check the distgit commit info against the git.url
+                # in our metadata.
+
+                try:
+                    target_branch = rpm_meta.config.content.source.git.branch.target
+                    if target_branch:
+                        _ = int(target_branch, 16)  # parse the name as a git commit
+                        # if we reach here, a git commit hash was declared as the
+                        # upstream source of the rpm package's content. We should verify
+                        # it perfectly matches what we find in the assembly build.
+                        # Each package build gets git commits encoded into the
+                        # release field of the NVR. So the NVR should contain
+                        # the desired commit.
+                        build_nvr = brew_build_dict['nvr']
+                        if target_branch[:7] not in build_nvr:
+                            # Impermissible because the assembly definition can simply be changed.
+                            issues.append(
+                                AssemblyIssue(
+                                    f'{dgk} build for rhel-{el_ver} did not find git commit {target_branch[:7]} in package RPM NVR {build_nvr}',
+                                    component=dgk,
                                 )
-                    except ValueError:
-                        # The meta's target branch a normal branch name
-                        # and not a git commit. When this is the case,
-                        # we don't try to assert anything about the build's
-                        # git commit.
-                        pass
+                            )
+                except ValueError:
+                    # The meta's target branch a normal branch name
+                    # and not a git commit. When this is the case,
+                    # we don't try to assert anything about the build's
+                    # git commit.
+                    pass
 
         return issues
 
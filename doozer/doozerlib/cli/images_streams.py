@@ -1,11 +1,14 @@
+import functools
 import hashlib
 import io
 import json
 import os
 import random
 import re
+import shlex
+import threading
 import time
-from typing import Dict, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import click
 import yaml
@@ -23,9 +26,9 @@ from artcommonlib.util import (
     remove_prefix,
     split_git_url,
 )
+from artcommonlib.yaml_util import SafeDumper, SafeLoader
 from dockerfile_parse import DockerfileParser
 from elliottlib.bzutil import JIRABugTracker
-from github import Auth, Github, GithubException, PullRequest, UnknownObjectException
 from jira import JIRA, Issue
 from jira.exceptions import JIRAError
 from tenacity import retry, stop_after_attempt, wait_fixed
@@ -43,6 +46,9 @@ from doozerlib.util import (
 )
 from pyartcd import jenkins
 
+if TYPE_CHECKING:
+    from github import PullRequest
+
 transform_rhel_7_base_repos = 'rhel-7/base-repos'
 transform_rhel_8_base_repos = 'rhel-8/base-repos'
 transform_rhel_9_base_repos = 'rhel-9/base-repos'
@@ -54,8 +60,8 @@ transform_rhel_8_ci_build_root = 'rhel-8/ci-build-root'
 transform_rhel_9_ci_build_root = 'rhel-9/ci-build-root'
 
 # The set of valid transforms
-transforms = set(
-    [
+transforms = frozenset(
+    {
         transform_rhel_7_base_repos,
         transform_rhel_8_base_repos,
         transform_rhel_9_base_repos,
@@ -65,9 +71,29 @@ transforms = set(
         transform_rhel_7_ci_build_root,
         transform_rhel_8_ci_build_root,
         transform_rhel_9_ci_build_root,
-    ]
+    }
 )
 
+# The transform Dockerfile templates shipped with doozer, e.g. doozerlib/cli/ci_transforms/rhel-7/base-repos/Dockerfile
+bundled_transform_templates = {
+    transform: os.path.join(os.path.dirname(__file__), 'ci_transforms', transform, 'Dockerfile')
+    for transform in transforms
+}
+
+# Matches a template ENV instruction which already sets OPENSHIFT_CI=true (e.g. the rhel-7 templates)
+_OPENSHIFT_CI_ENV_RE = re.compile(r'^\s*ENV\s+(?:.*\s)?OPENSHIFT_CI=true\s*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_transform_template(transform_template: str) -> str:
+    """
+    Reads a transform Dockerfile template. Entries commonly share transforms, so each
+    template is only read once.
+    :param transform_template: Path to the template Dockerfile
+    """
+    with open(transform_template, mode='r', encoding='utf-8') as tt:
+        return tt.read()
+
 
 def get_image_digest(pullspec: str, registry_config: Optional[str] = None) -> Optional[str]:
     """
@@ -289,6 +315,14 @@ def images_streams_mirror(
 
     upstreaming_entries = _get_upstreaming_entries(runtime, streams, image_names=images)
 
+    existing_destinations: Dict[str, bool] = {}
+    if only_if_missing:
+        # Each probe is an `oc image info` registry round-trip. Issue them all at once
+        # instead of one by one while walking the entries below.
+        existing_destinations = _probe_mirror_destinations(
+            runtime, upstreaming_entries, force=force, registry_config_file=registry_config_file
+        )
+
     for upstream_entry_name, config in upstreaming_entries.items():
         if config.mirror is True or force:
             upstream_dest = config.upstream_image
@@ -316,24 +350,8 @@ def images_streams_mirror(
             destinations_to_check = {}
 
             if only_if_missing:
-                # Check main destination (AMD64)
-                amd64_info = oc_image_info_for_arch(
-                    upstream_dest, go_arch='amd64', registry_config=registry_config_file, strict=False
-                )
-                destinations_to_check[upstream_dest] = amd64_info is not None
-
-                # Check ARM64 if needed
-                if mirror_arm:
-                    arm64_info = oc_image_info(
-                        f'{upstream_dest}-arm64', registry_config=registry_config_file, strict=False
-                    )
-                    destinations_to_check[f'{upstream_dest}-arm64'] = arm64_info is not None
-
-                # Check upstream_image_mirror destinations
-                if config.upstream_image_mirror is not Missing:
-                    for mirror_dest in config.upstream_image_mirror:
-                        mirror_info = oc_image_info(mirror_dest, registry_config=registry_config_file, strict=False)
-                        destinations_to_check[mirror_dest] = mirror_info is not None
+                for dest in _get_mirror_destinations(config, mirror_arm):
+                    destinations_to_check[dest] = existing_destinations[dest]
 
                 # Check if ALL destinations exist
                 all_exist = all(destinations_to_check.values())
@@ -394,6 +412,56 @@ def images_streams_mirror(
                         mirror_image(priv_cmd, upstream_image_mirror_dest)
 
 
+def _get_mirror_destinations(config, mirror_arm: bool) -> List[str]:
+    """
+    Lists the pullspecs an upstreaming entry mirrors to. The first element is
+    the main (amd64) destination.
+    :param config: The upstreaming entry
+    :param mirror_arm: Whether an arm64 variant of the main destination is mirrored as well
+    """
+    upstream_dest = config.upstream_image
+    if config.upstream_image_base is not Missing:
+        upstream_dest = config.upstream_image_base
+    destinations = [upstream_dest]
+    if mirror_arm:
+        destinations.append(f'{upstream_dest}-arm64')
+    if config.upstream_image_mirror is not Missing:
+        destinations.extend(config.upstream_image_mirror)
+    return destinations
+
+
+def _probe_mirror_destinations(
+    runtime, upstreaming_entries, force: bool, registry_config_file: Optional[str]
+) -> Dict[str, bool]:
+    """
+    Checks, in parallel, which mirror destinations already exist upstream.
+    :return: A map of destination pullspec => whether it exists
+    """
+    probes: Dict[str, bool] = {}  # destination => whether to probe only the amd64 manifest
+    for config in upstreaming_entries.values():
+        if not (config.mirror is True or force) or config.upstream_image is Missing:
+            continue
+        mirror_arm = config.upstream_image_base is not Missing and "aarch64" in runtime.arches
+        main_dest, *other_dests = _get_mirror_destinations(config, mirror_arm)
+        probes[main_dest] = True
+        for dest in other_dests:
+            probes.setdefault(dest, False)
+
+    def exists(dest, amd64_only):
+        if amd64_only:
+            info = oc_image_info_for_arch(dest, go_arch='amd64', registry_config=registry_config_file, strict=False)
+        else:
+            info = oc_image_info(dest, registry_config=registry_config_file, strict=False)
+        return info is not None
+
+    results = exectools.parallel_exec(
+        lambda probe, _: exists(*probe),
+        list(probes.items()),
+        n_threads=16,
+    ).get()
+    return dict(zip(probes.keys(), results))
+
+
 @images_streams.command(
     'check-upstream',
     short_help='Check and sync QCI images to imagestreams (mirrors to GC-prevention tags and updates references)',
@@ -436,12 +504,24 @@ def images_streams_check_upstream(runtime, streams, images, live_test_mode, dry_
 
     upstreaming_entries = _get_upstreaming_entries(runtime, streams, image_names=images)
 
+    openshift_imagestream_prefixes = (
+        'registry.ci.openshift.org/',
+        'registry.svc.ci.openshift.org/',
+    )
+
+    # Look up all the imagestream tags we are interested in with one query per namespace
+    # rather than one query per entry.
+    istag_names_by_namespace: Dict[str, Set[str]] = {}
+    for config in upstreaming_entries.values():
+        if config.upstream_image.startswith(openshift_imagestream_prefixes):
+            _, dest_ns, dest_istag = config.upstream_image.rsplit('/', maxsplit=2)
+            if live_test_mode:
+                dest_istag += '.test'
+            istag_names_by_namespace.setdefault(dest_ns, set()).add(dest_istag)
+    existing_istags = _get_imagestream_tags(runtime, istag_names_by_namespace)
+
     for upstream_entry_name, config in upstreaming_entries.items():
         upstream_dest = config.upstream_image
-        openshift_imagestream_prefixes = (
-            'registry.ci.openshift.org/',
-            'registry.svc.ci.openshift.org/',
-        )
         if not upstream_dest.startswith(openshift_imagestream_prefixes):
             istags_status.append(f'SKIP: {upstream_entry_name}\nNot an OpenShift imagestream target: {upstream_dest}')
             continue
@@ -454,14 +534,13 @@ def images_streams_check_upstream(runtime, streams, images, live_test_mode, dry_
         dest_imagestream, dest_tag = dest_istag.split(':')
 
         # Check imagestream tag exists and inspect its configuration
-        rc, stdout, stderr = exectools.cmd_gather(f'oc get -n {dest_ns} istag {dest_istag} -o json')
-        if rc:
+        istag_data = existing_istags.get((dest_ns, dest_istag))
+        if istag_data is None:
             istags_status.append(
                 f'ERROR: {upstream_entry_name}\nImagestream tag does not exist: {dest_ns}/istag/{dest_istag}'
             )
         else:
             try:
-                istag_data = json.loads(stdout)
                 # Check if it's referencing QCI by sha256
                 image_ref = istag_data.get('tag', {}).get('from', {}).get('name', '')
                 ref_policy = istag_data.get('tag', {}).get('referencePolicy', {}).get('type', '')
@@ -497,22 +576,15 @@ def images_streams_check_upstream(runtime, streams, images, live_test_mode, dry_
                 # Check if imagestream already points to this digest
                 needs_sync = False
                 try:
-                    rc_istag, istag_stdout, istag_stderr = exectools.cmd_gather(
-                        f'oc get -n {dest_ns} istag {dest_istag} -o json'
-                    )
-                    if rc_istag == 0:
-                        try:
-                            istag_data = json.loads(istag_stdout)
-                            istag_ref = istag_data.get('tag', {}).get('from', {}).get('name', '')
-                            # Extract digest from imagestream reference (quay-proxy.ci.openshift.org/openshift/ci@sha256:...)
-                            if '@' in istag_ref:
-                                istag_digest = istag_ref.split('@')[1]
-                                if istag_digest != current_digest:
-                                    needs_sync = True
-                            else:
-                                needs_sync = True  # Not using digest reference
-                        except json.JSONDecodeError:
-                            needs_sync = True  # Can't parse, assume needs sync
+                    if istag_data is not None:
+                        istag_ref = istag_data.get('tag', {}).get('from', {}).get('name', '')
+                        # Extract digest from imagestream reference (quay-proxy.ci.openshift.org/openshift/ci@sha256:...)
+                        if '@' in istag_ref:
+                            istag_digest = istag_ref.split('@')[1]
+                            if istag_digest != current_digest:
+                                needs_sync = True
+                        else:
+                            needs_sync = True  # Not using digest reference
                     else:
                         needs_sync = True  # Imagestream tag doesn't exist
 
@@ -585,26 +657,47 @@ def images_streams_check_upstream(runtime, streams, images, live_test_mode, dry_
     if live_test_mode:
         group_label += '.test'
 
-    bc_stdout, bc_stderr = exectools.cmd_assert(f'oc -n ci get -o=wide buildconfigs -l art-builder-group={group_label}')
-    builds_stdout, builds_stderr = exectools.cmd_assert(
-        f'oc -n ci get -o=wide builds -l art-builder-group={group_label}'
+    # One apiserver round-trip lists both kinds; oc prints a table for each.
+    resources_stdout, resources_stderr = exectools.cmd_assert(
+        f'oc -n ci get -o=wide buildconfigs,builds -l art-builder-group={group_label}'
     )
-    print('Build configs:')
-    print(bc_stdout or bc_stderr)
-    print()
-    print('Recent builds:')
-    print(builds_stdout or builds_stderr)
-    print()
+    print(resources_stdout or resources_stderr)
 
+    # Each report is written with a single call; entries are separated by a blank line.
     print('QCI image status:')
-    for status in qci_status:
-        print(status)
-        print()
+    if qci_status:
+        print('\n\n'.join(qci_status), end='\n\n')
 
     print('Imagestream tag status:')
-    for istag_status in istags_status:
-        print(istag_status)
-        print()
+    if istags_status:
+        print('\n\n'.join(istags_status), end='\n\n')
+
+
+def _get_imagestream_tags(runtime, istag_names_by_namespace: Dict[str, Set[str]]) -> Dict[Tuple[str, str], Dict]:
+    """
+    Fetches imagestream tags with a single `oc get` per namespace.
+    :param runtime: The runtime object
+    :param istag_names_by_namespace: A map of namespace => imagestream tag names (e.g. '4.17:base-rhel9')
+    :return: A map of (namespace, imagestream tag name) => imagestream tag object. Tags which do not
+            exist (or could not be retrieved) are absent from the map.
+    """
+    istags = {}
+    for namespace, names in istag_names_by_namespace.items():
+        rc, stdout, stderr = exectools.cmd_gather(
+            f'oc get -n {namespace} istag {" ".join(sorted(names))} --ignore-not-found -o json'
+        )
+        if rc:
+            runtime.logger.warning(f'Unable to get imagestream tags in namespace {namespace}: {stderr}')
+            continue
+        if not stdout.strip():
+            # Nothing was found
+            continue
+        result = json.loads(stdout)
+        # oc returns the object itself when a single name is requested and a List otherwise
+        items = result.get('items', []) if result.get('kind') == 'List' else [result]
+        for item in items:
+            istags[(namespace, item['metadata']['name'])] = item
+    return istags
 
 
 def get_eligible_buildconfigs(runtime, streams, live_test_mode, images=()):
@@ -689,6 +782,8 @@ def images_streams_start_buildconfigs(
 
     # Track triggered builds for post-build preservation
     triggered_builds = []
+    # Buildconfigs which have been prepared and can be started
+    bc_names_to_start = []
 
     for bc in buildconfigs:
         bc_name = bc['metadata']['name']
@@ -926,30 +1021,38 @@ def images_streams_start_buildconfigs(
                 else:
                     print(f'  The buildconfig will create the initial image at {qci_pullspec}')
 
-        # Finally, trigger the build
+        # Finally, queue the build to be triggered
         # NOTE: We only reach here if:
         # 1. No image existed (initial migration), OR
         # 2. Image existed AND mirroring AND imagestream update both succeeded
-        print(f'Triggering build: {bc_name}')
+        bc_names_to_start.append(bc_name)
+        # Track build for post-build preservation
+        triggered_builds.append((bc_name, qci_pullspec, dest_ns, dest_imagestream, dest_tag))
+
+    def start_build(bc_name):
         cmd = f'oc -n ci start-build {bc_name}'
         if as_user:
             cmd += f' --as {as_user}'
         if dry_run:
-            print(f'Would have run: {cmd}')
-            triggered_builds.append((bc_name, qci_pullspec, dest_ns, dest_imagestream, dest_tag))
-        else:
-            stdout, stderr = exectools.cmd_assert(cmd, retries=3)
-            print('   ' + stdout or stderr)
-            # Track build for post-build preservation
-            triggered_builds.append((bc_name, qci_pullspec, dest_ns, dest_imagestream, dest_tag))
+            return f'Would have run: {cmd}'
+        stdout, stderr = exectools.cmd_assert(cmd, retries=3)
+        return stdout or stderr
+
+    # Builds are independent of each other, so trigger them all at once
+    start_build_outputs = exectools.parallel_exec(
+        lambda bc_name, _: start_build(bc_name),
+        bc_names_to_start,
+        n_threads=8,
+    ).get()
+    for bc_name, output in zip(bc_names_to_start, start_build_outputs):
+        print(f'Triggering build: {bc_name}')
+        print('   ' + output)
 
     # Post-build preservation: wait for builds and preserve newly built images
     if triggered_builds and not dry_run:
         print('\n=== Post-Build Preservation ===')
         print(f'Waiting for {len(triggered_builds)} builds to complete...')
 
-        import time
-
         overall_timeout = 3600  # 1 hour total for all builds
         overall_start_time = time.time()
 
@@ -1123,12 +1226,11 @@ def _get_upstreaming_entries(runtime, stream_names=None, image_names=None):
             if config.upstream_image is not Missing:
                 upstreaming_entries[stream] = streams_config[stream]
 
+    image_metas = {}  # entry name => image meta
     if fetch_all_image_metas:
         for image_meta in runtime.ordered_image_metas():
             if image_meta.config.content.source.ci_alignment.upstream_image is not Missing:
-                entry = _get_upstreaming_entry_for_image(runtime, image_meta)
-                if entry is not None:
-                    upstreaming_entries[image_meta.distgit_key] = entry
+                image_metas[image_meta.distgit_key] = image_meta
 
     elif image_names:
         for name in image_names:
@@ -1137,9 +1239,17 @@ def _get_upstreaming_entries(runtime, stream_names=None, image_names=None):
                 raise IOError(f'Image {name} not found in group metadata')
             if meta.config.content.source.ci_alignment.upstream_image is Missing:
                 raise IOError(f'Image {name} does not have ci_alignment.upstream_image set; not eligible for CI sync')
-            entry = _get_upstreaming_entry_for_image(runtime, meta)
-            if entry is not None:
-                upstreaming_entries[name] = entry
+            image_metas[name] = meta
+
+    # Finding the latest build of each image is a remote lookup; do them concurrently.
+    entries = exectools.parallel_exec(
+        lambda image_meta, _: _get_upstreaming_entry_for_image(runtime, image_meta),
+        list(image_metas.values()),
+        n_threads=8,
+    ).get()
+    for name, entry in zip(image_metas, entries):
+        if entry is not None:
+            upstreaming_entries[name] = entry
 
     return upstreaming_entries
 
@@ -1219,6 +1329,40 @@ def images_streams_gen_buildconfigs(runtime, streams, images, output, as_user, a
 
     buildconfig_definitions = []
 
+    @functools.lru_cache(maxsize=None)
+    def get_localdev_repo_run(profile) -> Optional[str]:
+        """
+        The images we push to CI are used in two contexts:
+        1. In CI builds, running on the CI clusters.
+        2. In local development (e.g. docker build).
+        This method is enabling the latter. If a developer is connected to the VPN,
+        they will not be able to resolve RPMs through the RPM mirroring service running
+        on CI, but they will be able to pull RPMs directly from the sources ART does.
+        Since skip_if_unavailable is True globally, it doesn't matter if they can't be
+        accessed via CI.
+        The repo files are written by a single RUN instruction (one layer), which only depends
+        on the group's repo configuration and is therefore computed once per profile.
+        """
+        commands = []
+        for repo_name, repo_desc in rpm_repos_conf.items():
+            localdev_repo_name = f'localdev-{repo_name}'
+            repo_conf = repo_desc.conf
+            ci_alignment = repo_conf.ci_alignment
+            if ci_alignment.localdev.enabled and profile in ci_alignment.profiles:
+                # CI only really deals with x86_64 at this time.
+                if repo_conf.baseurl.unsigned:
+                    x86_64_url = repo_conf.baseurl.unsigned.x86_64
+                else:
+                    x86_64_url = repo_conf.baseurl.x86_64
+                if not x86_64_url:
+                    raise IOError(f'Expected x86_64 baseurl for repo {repo_name}')
+                commands.append(
+                    f"echo -e '[{localdev_repo_name}]\\nname = {localdev_repo_name}\\nid = {localdev_repo_name}\\nbaseurl = {x86_64_url}\\nenabled = 1\\ngpgcheck = 0\\nsslverify=0\\n' > /etc/yum.repos.d/{localdev_repo_name}.repo"
+                )
+        if not commands:
+            return None
+        return 'RUN ' + ' \\\n    && '.join(commands)
+
     upstreaming_entries = _get_upstreaming_entries(runtime, streams, image_names=images)
 
     for upstream_entry_name, config in upstreaming_entries.items():
@@ -1229,7 +1373,7 @@ def images_streams_gen_buildconfigs(runtime, streams, images, output, as_user, a
 
         if transform not in transforms:
             raise IOError(
-                f'Unable to render buildconfig for upstream config {upstream_entry_name} - transform {transform} not found within {transforms}'
+                f'Unable to render buildconfig for upstream config {upstream_entry_name} - transform {transform} not found within {sorted(transforms)}'
             )
 
         upstream_dest = config.upstream_image
@@ -1251,105 +1395,81 @@ def images_streams_gen_buildconfigs(runtime, streams, images, output, as_user, a
             dest_istag += '.test'
         dest_imagestream, dest_tag = dest_istag.split(':')
 
-        python_file_dir = os.path.dirname(__file__)
-
         # should align with files like: doozerlib/cli/ci_transforms/rhel-7/base-repos
         # OR ocp-build-data branch ci_transforms/rhel-7/base-repos . The latter is given
         # priority.
         ocp_build_data_transform = os.path.join(runtime.data_dir, 'ci_transforms', transform, 'Dockerfile')
         if os.path.exists(ocp_build_data_transform):
-            transform_template = os.path.join(runtime.data_dir, 'ci_transforms', transform, 'Dockerfile')
+            transform_template = ocp_build_data_transform
         else:
             # fall back to the doozerlib versions
-            transform_template = os.path.join(python_file_dir, 'ci_transforms', transform, 'Dockerfile')
-
-        with open(transform_template, mode='r', encoding='utf-8') as tt:
-            transform_template_content = tt.read()
+            transform_template = bundled_transform_templates[transform]
 
-        dfp = DockerfileParser(cache_content=True, fileobj=io.BytesIO())
-        dfp.content = transform_template_content
+        # The Dockerfile is assembled as plain text; nothing here needs to be parsed.
+        template_content = _load_transform_template(transform_template)
+        dockerfile_lines = [template_content.rstrip('\n')]
 
-        # Make sure that upstream images can discern they are building in CI with ART equivalent images
-        dfp.envs['OPENSHIFT_CI'] = 'true'
+        if not _OPENSHIFT_CI_ENV_RE.search(template_content):
+            # Make sure that upstream images can discern they are building in CI with ART equivalent images
+            dockerfile_lines.append('ENV OPENSHIFT_CI=true')
 
-        dfp.labels['io.k8s.display-name'] = f'{dest_imagestream}-{dest_tag}'
-        dfp.labels['io.k8s.description'] = f'ART equivalent image {group_label}-{upstream_entry_name} - {transform}'
-        dfp.add_lines('USER 0')  # Make sure we are root so that repos can be modified
+        display_name = f'{dest_imagestream}-{dest_tag}'
+        description = f'ART equivalent image {group_label}-{upstream_entry_name} - {transform}'
+        dockerfile_lines.append(f'LABEL io.k8s.display-name={shlex.quote(display_name)}')
+        dockerfile_lines.append(f'LABEL io.k8s.description={shlex.quote(description)}')
+        dockerfile_lines.append('USER 0')  # Make sure we are root so that repos can be modified
 
         def add_localdev_repo_profile(profile):
-            """
-            The images we push to CI are used in two contexts:
-            1. In CI builds, running on the CI clusters.
-            2. In local development (e.g. docker build).
-            This method is enabling the latter. If a developer is connected to the VPN,
-            they will not be able to resolve RPMs through the RPM mirroring service running
-            on CI, but they will be able to pull RPMs directly from the sources ART does.
-            Since skip_if_unavailable is True globally, it doesn't matter if they can't be
-            accessed via CI.
-            """
-            for repo_name in rpm_repos_conf.keys():
-                repo_desc = rpm_repos_conf[repo_name]
-                localdev_repo_name = f'localdev-{repo_name}'
-                repo_conf = repo_desc.conf
-                ci_alignment = repo_conf.ci_alignment
-                if ci_alignment.localdev.enabled and profile in ci_alignment.profiles:
-                    # CI only really deals with x86_64 at this time.
-                    if repo_conf.baseurl.unsigned:
-                        x86_64_url = repo_conf.baseurl.unsigned.x86_64
-                    else:
-                        x86_64_url = repo_conf.baseurl.x86_64
-                    if not x86_64_url:
-                        raise IOError(f'Expected x86_64 baseurl for repo {repo_name}')
-                    dfp.add_lines(
-                        f"RUN echo -e '[{localdev_repo_name}]\\nname = {localdev_repo_name}\\nid = {localdev_repo_name}\\nbaseurl = {x86_64_url}\\nenabled = 1\\ngpgcheck = 0\\nsslverify=0\\n' > /etc/yum.repos.d/{localdev_repo_name}.repo"
-                    )
+            localdev_repo_run = get_localdev_repo_run(profile)
+            if localdev_repo_run:
+                dockerfile_lines.append(localdev_repo_run)
 
         if transform == transform_rhel_9_base_repos or config.transform == transform_rhel_9_golang:
             # The repos transform create a build config that will layer the base image with CI appropriate yum
             # repository definitions.
-            dfp.add_lines(
+            dockerfile_lines.append(
                 f'RUN rm -rf /etc/yum.repos.d/*.repo && curl http://base-{major}-{minor}-rhel9.ocp.svc > /etc/yum.repos.d/ci-rpm-mirrors.repo'
             )
 
             # Allow the base repos to be used BEFORE art begins mirroring 4.x to openshift mirrors.
             # This allows us to establish this locations later -- only disrupting CI for those
             # components that actually need reposync'd RPMs from the mirrors.
-            dfp.add_lines('RUN yum config-manager --setopt=skip_if_unavailable=True --save')
+            dockerfile_lines.append('RUN yum config-manager --setopt=skip_if_unavailable=True --save')
             add_localdev_repo_profile('el9')
 
         if transform == transform_rhel_8_base_repos or config.transform == transform_rhel_8_golang:
             # The repos transform create a build config that will layer the base image with CI appropriate yum
             # repository definitions.
-            dfp.add_lines(
+            dockerfile_lines.append(
                 f'RUN rm -rf /etc/yum.repos.d/*.repo && curl http://base-{major}-{minor}-rhel8.ocp.svc > /etc/yum.repos.d/ci-rpm-mirrors.repo'
             )
 
             # Allow the base repos to be used BEFORE art begins mirroring 4.x to openshift mirrors.
             # This allows us to establish this locations later -- only disrupting CI for those
             # components that actually need reposync'd RPMs from the mirrors.
-            dfp.add_lines('RUN yum config-manager --setopt=skip_if_unavailable=True --save')
+            dockerfile_lines.append('RUN yum config-manager --setopt=skip_if_unavailable=True --save')
             add_localdev_repo_profile('el8')
 
         if transform == transform_rhel_7_base_repos or config.transform == transform_rhel_7_golang:
             # The repos transform create a build config that will layer the base image with CI appropriate yum
             # repository definitions.
-            dfp.add_lines(
+            dockerfile_lines.append(
                 f'RUN rm -rf /etc/yum.repos.d/*.repo && curl http://base-{major}-{minor}.ocp.svc > /etc/yum.repos.d/ci-rpm-mirrors.repo'
             )
             # Allow the base repos to be used BEFORE art begins mirroring 4.x to openshift mirrors.
             # This allows us to establish this locations later -- only disrupting CI for those
             # components that actually need reposync'd RPMs from the mirrors.
             add_localdev_repo_profile('el7')
-            dfp.add_lines("RUN yum-config-manager --save '--setopt=skip_if_unavailable=True'")
-            dfp.add_lines("RUN yum-config-manager --save '--setopt=*.skip_if_unavailable=True'")
+            dockerfile_lines.append("RUN yum-config-manager --save '--setopt=skip_if_unavailable=True'")
+            dockerfile_lines.append("RUN yum-config-manager --save '--setopt=*.skip_if_unavailable=True'")
 
         if config.final_user:
             # If the image should not run as root/0, then allow metadata to specify a
             # true final user.
-            dfp.add_lines(f'USER {config.final_user}')
+            dockerfile_lines.append(f'USER {config.final_user}')
 
         # We've arrived at a Dockerfile.
-        dockerfile_content = dfp.content
+        dockerfile_content = '\n'.join(dockerfile_lines) + '\n'
 
         # Construct QCI destination tag: quay.io/openshift/ci:art-builder-{MAJOR}.{MINOR}-{tag}
         # Example: quay.io/openshift/ci:art-builder-4.19-base-rhel9
@@ -1409,7 +1529,7 @@ def images_streams_gen_buildconfigs(runtime, streams, images, output, as_user, a
     with open(output, mode='w+', encoding='utf-8') as f:
         objects = list()
         objects.extend(buildconfig_definitions)
-        yaml.dump_all(objects, f, default_flow_style=False)
+        yaml.dump_all(objects, f, Dumper=SafeDumper, default_flow_style=False)
 
     if apply:
         if buildconfig_definitions:
@@ -1423,36 +1543,136 @@ def images_streams_gen_buildconfigs(runtime, streams, images, output, as_user, a
 
 
 def calc_parent_digest(parent_images):
-    m = hashlib.md5()
+    # These digests are only compared against each other within a single run, so
+    # any fast hash will do.
+    m = hashlib.blake2b(digest_size=16)
     m.update(';'.join(parent_images).encode('utf-8'))
     return m.hexdigest()
 
 
+# Matches the start of an ARG or FROM instruction.
+_ARG_OR_FROM_RE = re.compile(r'^\s*(ARG|FROM)\s', re.IGNORECASE)
+
+
+def iter_parent_instruction_lines(dockerfile_lines):
+    """
+    Filters Dockerfile lines down to those that determine the parent images: FROM instructions
+    and the ARG instructions preceding the first FROM (which may be referenced by FROM).
+    Continuation lines of those instructions are kept as well.
+    :param dockerfile_lines: An iterable of Dockerfile lines, e.g. an open file.
+    :return: A generator of the relevant lines.
+    """
+    seen_from = False
+    keep = False
+    continued = False  # Whether the current line continues the previous instruction
+    for line in dockerfile_lines:
+        if not continued:
+            match = _ARG_OR_FROM_RE.match(line)
+            is_from = bool(match) and match.group(1).upper() == 'FROM'
+            keep = is_from or (bool(match) and not seen_from)
+            seen_from = seen_from or is_from
+        continued = line.rstrip().endswith('\\')
+        if keep:
+            yield line if line.endswith('\n') else line + '\n'
+
+
+def _extract_parent_digest_from_lines(dockerfile_lines):
+    # Only FROM and top-level ARG instructions affect the parent images, so the parser is
+    # given just those rather than the entire Dockerfile.
+    dfp = DockerfileParser(cache_content=True, fileobj=io.BytesIO())
+    dfp.content = ''.join(iter_parent_instruction_lines(dockerfile_lines))
+    return calc_parent_digest(dfp.parent_images), dfp.parent_images
+
+
+def extract_parent_digest_from_content(dockerfile_content: str):
+    return _extract_parent_digest_from_lines(dockerfile_content.splitlines(keepends=True))
+
+
 def extract_parent_digest(dockerfile_path):
     with dockerfile_path.open(mode='r') as handle:
-        dfp = DockerfileParser(cache_content=True, fileobj=io.BytesIO())
-        dfp.content = handle.read()
-    return calc_parent_digest(dfp.parent_images), dfp.parent_images
+        return _extract_parent_digest_from_lines(handle)
+
+
+# Matches a FROM instruction, capturing everything before the image (including flags like --platform),
+# the image itself, and the remainder of the line (e.g. " AS builder").
+_FROM_INSTRUCTION_RE = re.compile(r'^(\s*FROM\s+(?:--\S+\s+)*)(\S+)(.*)$', re.IGNORECASE | re.DOTALL)
+
+
+def rewrite_parent_images(dockerfile_content: str, parent_images: List[str]) -> str:
+    """
+    Replaces the image in each FROM instruction, in order, with the given parent images. Flags and
+    stage names are preserved and all other lines are left untouched, so the Dockerfile does not
+    need to be parsed. If a FROM instruction is split across continuation lines, the Dockerfile is
+    rewritten with DockerfileParser instead.
+    :param dockerfile_content: The content of the Dockerfile
+    :param parent_images: The desired image for each FROM instruction
+    :return: The updated Dockerfile content
+    :raises ValueError: If the number of FROM instructions differs from the number of parent images
+    """
+    lines = dockerfile_content.splitlines(keepends=True)
+    parents = list(parent_images)
+    from_count = 0
+    continued = False  # Whether the current line continues the previous instruction
+    for index, line in enumerate(lines):
+        match = None if continued else _FROM_INSTRUCTION_RE.match(line)
+        continued = line.rstrip().endswith('\\')
+        if not match:
+            continue
+        if continued:
+            # The image (or part of the instruction) is on a continuation line; let the parser handle it.
+            return _rewrite_parent_images_with_parser(dockerfile_content, parents)
+        from_count += 1
+        if from_count <= len(parents):
+            lines[index] = f'{match.group(1)}{parents[from_count - 1]}{match.group(3)}'
+    if from_count != len(parents):
+        raise ValueError(f'Dockerfile has {from_count} FROM instructions but {len(parents)} parent images were given')
+    return ''.join(lines)
+
+
+def _rewrite_parent_images_with_parser(dockerfile_content: str, parent_images: List[str]) -> str:
+    dfp = DockerfileParser(cache_content=True, fileobj=io.BytesIO())
+    dfp.content = dockerfile_content
+    from_count = len(dfp.parent_images)
+    if from_count != len(parent_images):
+        raise ValueError(
+            f'Dockerfile has {from_count} FROM instructions but {len(parent_images)} parent images were given'
+        )
+    dfp.parent_images = parent_images
+    return dfp.content
+
+
+def compute_dockerfile_content_digest(content: bytes):
+    # Standardize linefeed; there is no need to decode the content to hash it.
+    content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
 def compute_dockerfile_digest(dockerfile_path):
-    with dockerfile_path.open(mode='r') as handle:
-        # Read in and standardize linefeed
-        content = '\n'.join(handle.read().splitlines())
-        m = hashlib.md5()
-        m.update(content.encode('utf-8'))
-        return m.hexdigest()
+    return compute_dockerfile_content_digest(dockerfile_path.read_bytes())
+
+
+def is_pr_already_exists_error(ge) -> bool:
+    """
+    Determine whether a GithubException raised by create_pull reports that a PR for the head already exists.
+    :param ge: The GithubException.
+    :return: True if GitHub rejected the PR because one already exists.
+    """
+    try:
+        errors = (ge.data or {}).get('errors') or []
+        return any('already exists' in (error.get('message') or '') for error in errors)
+    except Exception:
+        # The payload did not have the expected structure; fall back to searching all of it.
+        return 'already exists' in json.dumps(ge.data)
 
 
-def resolve_upstream_from(runtime, image_entry):
+def resolve_upstream_from(runtime, image_entry, major=None, minor=None):
     """
     :param runtime: The runtime object
     :param image_entry: A builder or from entry. e.g. { 'member': 'openshift-enterprise-base' }  or { 'stream': 'golang; }
+    :param major: The group's MAJOR version. Read from the group config if not specified.
+    :param minor: The group's MINOR version. Read from the group config if not specified.
     :return: The upstream CI pullspec to which this entry should resolve.
     """
-    major = runtime.group_config.vars['MAJOR']
-    minor = runtime.group_config.vars['MINOR']
-
     if image_entry.member:
         target_meta = runtime.resolve_image(image_entry.member, True)
 
@@ -1468,6 +1688,9 @@ def resolve_upstream_from(runtime, image_entry):
             # In release payloads, images are promoted into an imagestream
             # tag name without the ose- prefix.
             image_name = remove_prefix(image_name, 'ose-')
+            if major is None or minor is None:
+                major = runtime.group_config.vars['MAJOR']
+                minor = runtime.group_config.vars['MINOR']
             # e.g. registry.ci.openshift.org/ocp/4.6:base
             return f'registry.ci.openshift.org/ocp/{major}.{minor}:{image_name}'
 
@@ -1478,6 +1701,25 @@ def resolve_upstream_from(runtime, image_entry):
         return runtime.resolve_stream(image_entry.stream).upstream_image
 
 
+@functools.lru_cache(maxsize=None)
+def _get_remote_branches(repo_url: str) -> FrozenSet[str]:
+    """
+    Lists the branches of a remote git repository. The result is cached so that each
+    remote is only queried once, no matter how many images build from it.
+    :param repo_url: The git URL of the remote repository
+    :return: The set of branch names (without the refs/heads/ prefix)
+    """
+    for _ in range(3):
+        # With --exit-code, rc 2 means the remote has no branches at all. That is an answer, not a
+        # transient failure, so only other non-zero exit codes are retried.
+        rc, out, err = exectools.cmd_gather(f'git ls-remote --exit-code --heads {repo_url}')
+        if rc in (0, 2):
+            break
+    else:
+        raise ChildProcessError(f'Unable to list branches of {repo_url}: {err}')
+    return frozenset(remove_prefix(line.split()[1], 'refs/heads/') for line in out.splitlines() if line.strip())
+
+
 def _get_upstream_source(runtime, image_meta, skip_branch_check=False):
     """
     Analyzes an image metadata to find the upstream URL and branch associated with its content.
@@ -1491,11 +1733,7 @@ def _get_upstream_source(runtime, image_meta, skip_branch_check=False):
         source_repo_url = image_meta.config.content.source.git.url
         source_repo_branch = image_meta.config.content.source.git.branch.target
         if not skip_branch_check:
-            branch_check, err = exectools.cmd_assert(
-                f'git ls-remote --heads {source_repo_url} {source_repo_branch}', strip=True, retries=3
-            )
-            if not branch_check:
-                # Output is empty if branch does not exist
+            if source_repo_branch not in _get_remote_branches(source_repo_url):
                 source_repo_branch = image_meta.config.content.source.git.branch.fallback
                 if source_repo_branch is Missing:
                     raise IOError(f'Unable to detect source repository branch for {image_meta.distgit_key}')
@@ -1568,7 +1806,7 @@ def prs_list(runtime, as_user, include_master):
     print(yaml.dump(retdata, default_flow_style=False, width=10000))
 
 
-def connect_issue_with_pr(pr: PullRequest.PullRequest, issue: str):
+def connect_issue_with_pr(pr: 'PullRequest.PullRequest', issue: str):
     """
     Aligns an existing Jira issue with a PR. Put the issue number in the title of the github pr.
     Args:
@@ -1590,7 +1828,7 @@ def connect_issue_with_pr(pr: PullRequest.PullRequest, issue: str):
         pr.edit(title=f"{issue}: {pr.title}")
 
 
-def reconcile_jira_issues(runtime, pr_map: Dict[str, Tuple[PullRequest.PullRequest, Optional[str]]], dry_run: bool):
+def reconcile_jira_issues(runtime, pr_map: Dict[str, Tuple['PullRequest.PullRequest', Optional[str]]], dry_run: bool):
     """
     Ensures there is a Jira issue open for reconciliation PRs.
     Args:
@@ -1879,6 +2117,9 @@ def images_streams_prs(
     add_auto_labels,
     add_label,
 ):
+    # PyGithub is only needed by this command; keep it out of the import path of the other images:streams commands.
+    from github import Auth, Github, GithubException, UnknownObjectException
+
     runtime.initialize(clone_distgits=False, clone_source=False, prevent_cloning=True)
     if not github_access_token:
         raise click.BadParameter(
@@ -1886,12 +2127,26 @@ def images_streams_prs(
             "because it forks repos and opens PRs as a user. GitHub App tokens cannot be used.",
             param_hint="'--github-access-token'",
         )
-    g = Github(auth=Auth.Token(github_access_token))
+    reconcile_threads = 8  # Number of images reconciled concurrently
+    # All workers share this client. Size its connection pool to match so that keep-alive connections
+    # are reused instead of being discarded (and re-handshaked) whenever more than the default pool
+    # size of requests are in flight. The default GithubRetry already retries transient and rate
+    # limit errors. Fetch the maximum page size so listing open PRs needs as few requests as possible.
+    g = Github(auth=Auth.Token(github_access_token), pool_size=reconcile_threads, per_page=100)
     github_user = g.get_user()
 
+    @functools.lru_cache(maxsize=None)
+    def get_repo(full_name: str):
+        # Many images share an upstream repository (and therefore a fork); only fetch each one once.
+        return g.get_repo(full_name)
+
     major = runtime.group_config.vars['MAJOR']
     minor = runtime.group_config.vars['MINOR']
     interstitial = int(interstitial)
+    # Image metadata links in PR descriptions all share this prefix; build it once rather than per image.
+    reconcile_url_base = (
+        f'{convert_remote_git_to_https(runtime.gitdata.origin_url)}/tree/{runtime.gitdata.commit_hash}/images'
+    )
 
     to_reconcile = runtime.group_config.reconciliation_prs.enabled
     if to_reconcile is not Missing and not to_reconcile:
@@ -1909,7 +2164,7 @@ def images_streams_prs(
     prs_in_master = (major == master_major and minor == master_minor) and not ignore_ci_master
 
     # map of distgit_key to (PR url, jenkins_build_url) associated with updates
-    pr_dgk_map: Dict[str, Tuple[PullRequest.PullRequest, Optional[str]]] = {}
+    pr_dgk_map: Dict[str, Tuple['PullRequest.PullRequest', Optional[str]]] = {}
     new_pr_links = {}
     skipping_dgks = set()  # If a distgit key is skipped, it children will see it in this list and skip themselves.
     checked_upstream_images = (
@@ -1917,7 +2172,57 @@ def images_streams_prs(
     )  # A PR will not be opened unless the upstream image exists; keep track of ones we have checked.
     errors_raised = False  # If failures are found when opening a PR, won't break the loop but will return an exit code to signal this event
 
-    for image_meta in runtime.ordered_image_metas():
+    # Many images share a source repository. Query the branches of each distinct repository
+    # concurrently up front; _get_upstream_source will then find them in the cache.
+    source_repo_urls = {
+        image_meta.config.content.source.git.url
+        for image_meta in runtime.ordered_image_metas()
+        if "git" in image_meta.config.content.source
+    }
+
+    def prefetch_remote_branches(url):
+        try:
+            _get_remote_branches(url)
+        except ChildProcessError as e:
+            # Errors only matter if an image actually needs this repository; they resurface then.
+            runtime.logger.warning(f'Unable to list branches of {url}: {e}')
+
+    exectools.parallel_exec(lambda url, _: prefetch_remote_branches(url), list(source_repo_urls), n_threads=16).get()
+
+    # Images are reconciled concurrently. A child image must see the outcome for its parent
+    # (an open PR or a skip), so it waits for its parent to be reconciled before deciding what to do.
+    # ordered_image_metas() lists parents before their children, so a waiting worker never blocks
+    # an image it depends upon.
+    parent_metas = {image_meta.distgit_key: image_meta.resolve_parent() for image_meta in runtime.ordered_image_metas()}
+    reconciled = {dgk: threading.Event() for dgk in parent_metas}
+    results_lock = threading.Lock()  # guards pr_dgk_map, new_pr_links, skipping_dgks and checked_upstream_images
+    pr_creation_lock = threading.Lock()
+    last_pr_created_at = 0.0  # time.monotonic() of the last PR opened; guarded by pr_creation_lock
+
+    # Many images share an upstream repository. List the open PRs of each repository once and filter
+    # them locally rather than asking GitHub for the PRs of every fork branch separately.
+    all_open_prs_by_repo: Dict[str, List['PullRequest.PullRequest']] = {}
+    open_prs_lock = threading.Lock()
+
+    def get_open_prs(public_source_repo, fork_branch_name: str) -> List['PullRequest.PullRequest']:
+        with open_prs_lock:
+            repo_prs = all_open_prs_by_repo.get(public_source_repo.full_name)
+        if repo_prs is None:
+            repo_prs = list(public_source_repo.get_pulls(state='open'))
+            with open_prs_lock:
+                all_open_prs_by_repo[public_source_repo.full_name] = repo_prs
+        return [
+            pr
+            for pr in repo_prs
+            if pr.head.ref == fork_branch_name and pr.head.user and pr.head.user.login == github_user.login
+        ]
+
+    def invalidate_open_prs(public_source_repo):
+        with open_prs_lock:
+            all_open_prs_by_repo.pop(public_source_repo.full_name, None)
+
+    def reconcile_image(image_meta: ImageMetadata):
+        nonlocal errors_raised, last_pr_created_at
         dgk = image_meta.distgit_key
         logger = image_meta.logger
         logger.info('Analyzing image')
@@ -1927,12 +2232,12 @@ def images_streams_prs(
         if streams_pr_config and streams_pr_config.enabled is not Missing and not streams_pr_config.enabled:
             # Make sure this is an explicit False. Missing means the default or True.
             logger.info('The image has alignment PRs disabled; ignoring')
-            continue
+            return
 
         from_config = image_meta.config['from']
         if not from_config:
             logger.info('Skipping PR check since there is no configured .from')
-            continue
+            return
 
         def check_if_upstream_image_exists(upstream_image):
             if upstream_image not in checked_upstream_images:
@@ -1946,9 +2251,10 @@ def images_streams_prs(
                     )
                     if not ignore_missing_images:
                         raise
-                checked_upstream_images.add(
-                    upstream_image
-                )  # Don't check this image again since it is a little slow to do so.
+                with results_lock:
+                    checked_upstream_images.add(
+                        upstream_image
+                    )  # Don't check this image again since it is a little slow to do so.
 
         desired_parents = []
 
@@ -1967,7 +2273,7 @@ def images_streams_prs(
             builders = from_config.builder or []
             for builder in builders:
                 try:
-                    upstream_image = resolve_upstream_from(runtime, builder)
+                    upstream_image = resolve_upstream_from(runtime, builder, major, minor)
                 except Exception as e:
                     message = f'Error while resolving upstream image for {builder} in {dgk} for {major}.{minor}: {e}'
                     logger.error(message)
@@ -1979,14 +2285,14 @@ def images_streams_prs(
                 desired_parents.append(upstream_image)
 
             try:
-                parent_upstream_image = resolve_upstream_from(runtime, from_config)
+                parent_upstream_image = resolve_upstream_from(runtime, from_config, major, minor)
             except Exception as e:
                 message = f'Error while resolving upstream image for {from_config} in {dgk} for {major}.{minor}: {e}'
                 logger.error(message)
                 raise IOError(message)
             if len(desired_parents) != len(builders) or not parent_upstream_image:
                 logger.warning('Unable to find all ART equivalent upstream images for this image')
-                continue
+                return
 
             desired_parents.append(parent_upstream_image)
 
@@ -1997,7 +2303,9 @@ def images_streams_prs(
         desired_ci_build_root_image = ''
         if streams_pr_config.ci_build_root is not Missing:
             try:
-                desired_ci_build_root_image = resolve_upstream_from(runtime, streams_pr_config.ci_build_root)
+                desired_ci_build_root_image = resolve_upstream_from(
+                    runtime, streams_pr_config.ci_build_root, major, minor
+                )
             except Exception as e:
                 message = f'Error while resolving ci_build_root {streams_pr_config.ci_build_root} in {dgk} for {major}.{minor}: {e}'
                 logger.error(message)
@@ -2021,7 +2329,7 @@ def images_streams_prs(
         if not source_repo_url or 'github.com' not in source_repo_url:
             # No upstream to clone; no PRs to open
             logger.info('Skipping PR check since there is no configured github source URL')
-            continue
+            return
 
         public_repo_url, public_branch, _ = SourceResolver.get_public_upstream(
             source_repo_url, runtime.group_config.public_upstreams
@@ -2037,7 +2345,7 @@ def images_streams_prs(
             logger.info(
                 f'Skipping PR for {runtime.group} : {dgk} / {public_repo_url} since associated public branch is {public_branch} but CI is tracking {master_major}.{master_minor} in that branch.'
             )
-            continue
+            return
 
         # There are two standard upstream branching styles:
         # release-4.x   : CI fast-forwards from default branch (master or main) when appropriate
@@ -2045,37 +2353,33 @@ def images_streams_prs(
         # For the former style, we may need to open the PRs against the default branch (master or main).
         # For the latter style, always open directly against named branch
         if public_branch.startswith('release-') and prs_in_master:
-            public_branches, _ = exectools.cmd_assert(f'git ls-remote --heads {public_repo_url}', strip=True)
-            public_branches = public_branches.splitlines()
-            priv_branches, _ = exectools.cmd_assert(f'git ls-remote --heads {source_repo_url}', strip=True)
-            priv_branches = priv_branches.splitlines()
-
-            if [bl for bl in public_branches if bl.endswith('/main')] and [
-                bl for bl in priv_branches if bl.endswith('/main')
-            ]:
+            public_branches = _get_remote_branches(public_repo_url)
+            priv_branches = _get_remote_branches(source_repo_url)
+
+            if 'main' in public_branches and 'main' in priv_branches:
                 public_branch = 'main'
-            elif [bl for bl in public_branches if bl.endswith('/master')] and [
-                bl for bl in priv_branches if bl.endswith('/master')
-            ]:
+            elif 'master' in public_branches and 'master' in priv_branches:
                 public_branch = 'master'
             else:
                 # There are ways of determining default branch without using naming conventions, but as of today, we don't need it.
-                raise IOError(f'Did not find master or main branch; unable to detect default branch: {public_branches}')
+                raise IOError(
+                    f'Did not find master or main branch; unable to detect default branch: {sorted(public_branches)}'
+                )
 
         _, org, repo_name = split_git_url(public_repo_url)
 
-        public_source_repo = g.get_repo(f'{org}/{repo_name}')
+        public_source_repo = get_repo(f'{org}/{repo_name}')
 
         try:
             fork_repo_name = f'{github_user.login}/{repo_name}'
-            fork_repo = g.get_repo(fork_repo_name)
+            fork_repo = get_repo(fork_repo_name)
         except UnknownObjectException:
             # Repo doesn't exist; fork it
             if dry_run:
                 logger.info(
                     f'DRY RUN: Would have forked {public_source_repo.full_name} to {fork_repo_name}. Moving to next image since fork is required to continue.'
                 )
-                continue
+                return
             else:
                 fork_repo = github_user.create_fork(public_source_repo)
 
@@ -2094,11 +2398,72 @@ def images_streams_prs(
             if ge.status != 404:
                 raise
 
+        # The path to the Dockerfile in the target branch
+        if image_meta.config.content.source.dockerfile is not Missing:
+            # Be aware that this attribute sometimes contains path elements too.
+            dockerfile_name = image_meta.config.content.source.dockerfile
+        else:
+            dockerfile_name = "Dockerfile"
+
+        if image_meta.config.content.source.path:
+            dockerfile_name = os.path.join(image_meta.config.content.source.path, dockerfile_name)
+
+        def close_unnecessary_prs():
+            if fork_branch:
+                for pr in get_open_prs(public_source_repo, fork_branch_name):
+                    if moist_run or dry_run:
+                        yellow_print(f'Would have closed existing PR: {pr.html_url}')
+                    else:
+                        yellow_print(f'Closing unnecessary PR: {pr.html_url}')
+                        pr.edit(state='closed')
+
+        # Most upstream repositories are already aligned with ART. Check that through the GitHub
+        # contents API first; the repository only needs to be cloned if a change must be proposed.
+        try:
+            public_dockerfile = public_source_repo.get_contents(dockerfile_name, ref=public_branch)
+            public_parent_digest, _ = extract_parent_digest_from_content(
+                public_dockerfile.decoded_content.decode('utf-8')
+            )
+            public_ci_build_root_coordinate = None
+            if desired_ci_build_root_coordinate:
+                try:
+                    public_ci_operator_config = public_source_repo.get_contents('.ci-operator.yaml', ref=public_branch)
+                    public_ci_build_root_coordinate = yaml.load(
+                        public_ci_operator_config.decoded_content, Loader=SafeLoader
+                    ).get('build_root_image', None)
+                except UnknownObjectException:
+                    pass
+        except Exception as e:
+            # Fall back to analyzing a clone, which also reports any problem properly
+            logger.info(f'Unable to check upstream state through the GitHub API; will clone instead: {e}')
+        else:
+            if desired_parent_digest == public_parent_digest and (
+                desired_ci_build_root_coordinate is None
+                or desired_ci_build_root_coordinate == public_ci_build_root_coordinate
+            ):
+                green_print(
+                    'Desired digest and source digest match; desired build_root unset OR coordinates match; Upstream is in a good state'
+                )
+                close_unnecessary_prs()
+                return
+
         public_repo_url = ensure_github_https_url(public_repo_url)
         fork_url = ensure_github_https_url(fork_repo.git_url)
         clone_dir = os.path.join(runtime.working_dir, 'clones', dgk)
-        # Clone the private url to make the best possible use of our doozer_cache
-        git_clone(source_repo_url, clone_dir, git_cache_dir=runtime.git_cache_dir)
+        # Only the tips of the public branch and the fork branch are ever read, and the single commit
+        # we push is made directly atop the public tip (which the fork network already has). So a
+        # shallow clone is sufficient and avoids transferring the full history of large upstreams.
+        # The persistent doozer git cache (if configured) is used as a reference, so objects it already
+        # holds from previous runs are not transferred again.
+        # Nothing is read from the cloned branch itself: the fork branch is read straight from its ref
+        # and the only working tree we need is that of the public branch. So skip the initial checkout
+        # rather than materializing a tree that is immediately replaced.
+        git_clone(
+            source_repo_url,
+            clone_dir,
+            gitargs=['--depth=1', '--no-tags', '--single-branch', '--shallow-submodules', '--no-checkout'],
+            git_cache_dir=runtime.git_cache_dir,
+        )
 
         with Dir(clone_dir):
             # Generate per-org auth credentials for each remote.
@@ -2107,42 +2472,29 @@ def images_streams_prs(
             # orgs (e.g. openshift-priv vs openshift vs openshift-bot).
             # Fetching each remote individually with the correct per-org
             # token avoids "Repository not found" auth errors.
-            priv_auth = get_github_git_auth_env(url=source_repo_url)
             pub_auth = get_github_git_auth_env(url=public_repo_url)
             fork_auth = build_git_auth_env(github_access_token)
 
             exectools.cmd_assert(f'git remote add public {public_repo_url}')
             exectools.cmd_assert(f'git remote add fork {fork_url}')
 
-            for remote_name, auth_env in [('origin', priv_auth), ('public', pub_auth), ('fork', fork_auth)]:
-                exectools.cmd_assert(f'git fetch {remote_name}', retries=3, set_env=auth_env)
-
-            # The path to the Dockerfile in the target branch
-            if image_meta.config.content.source.dockerfile is not Missing:
-                # Be aware that this attribute sometimes contains path elements too.
-                dockerfile_name = image_meta.config.content.source.dockerfile
-            else:
-                dockerfile_name = "Dockerfile"
-
-            df_path = Dir.getpath()
-            if image_meta.config.content.source.path:
-                dockerfile_name = os.path.join(image_meta.config.content.source.path, dockerfile_name)
+            # Fetch only the branches we read; this also updates their remote-tracking refs (e.g. public/main).
+            # These cannot be combined into `git fetch --all --jobs=N` since each remote needs its own
+            # credentials. They also must not run concurrently: each shallow fetch takes .git/shallow.lock.
+            # Parallelism comes from reconciling several images at once instead.
+            fetches = [('public', public_branch, pub_auth)]
+            if fork_branch:
+                fetches.append(('fork', fork_branch_name, fork_auth))
+            for remote_name, branch_name, auth_env in fetches:
+                exectools.cmd_assert(
+                    f'git fetch --depth=1 --no-tags {remote_name} {branch_name}', retries=3, set_env=auth_env
+                )
 
-            df_path = df_path.joinpath(dockerfile_name).resolve()
+            df_path = Dir.getpath().joinpath(dockerfile_name).resolve()
             ci_operator_config_path = (
                 Dir.getpath().joinpath('.ci-operator.yaml').resolve()
             )  # https://docs.ci.openshift.org/docs/architecture/ci-operator/#build-root-image
 
-            assignee = None
-            try:
-                root_owners_path = Dir.getpath().joinpath('OWNERS')
-                if root_owners_path.exists():
-                    parsed_owners = yaml.safe_load(root_owners_path.read_text())
-                    if 'approvers' in parsed_owners and len(parsed_owners['approvers']) > 0:
-                        assignee = random.choice(parsed_owners['approvers'])
-            except Exception as owners_e:
-                yellow_print(f'Error finding assignee in OWNERS for {public_repo_url}: {owners_e}')
-
             fork_ci_build_root_coordinate = None
             fork_branch_df_digest = None  # digest of dockerfile image names
             if fork_branch:
@@ -2150,36 +2502,52 @@ def images_streams_prs(
                 # OR behind the times (e.g. if someone committed changes to the upstream Dockerfile).
                 # Let's check.
 
-                # If there is already an art reconciliation branch, get an MD5
-                # of the FROM images in the Dockerfile in that branch.
-                exectools.cmd_assert(f'git checkout fork/{fork_branch_name}')
-                if df_path.exists():
-                    fork_branch_df_digest = compute_dockerfile_digest(df_path)
+                # If there is already an art reconciliation branch, get a digest
+                # of the Dockerfile in that branch. The files are read straight from the
+                # fetched ref; checking the branch out would rewrite the whole working tree.
+                rc, fork_dockerfile, _ = exectools.cmd_gather(
+                    ['git', 'show', f'fork/{fork_branch_name}:./{dockerfile_name}']
+                )
+                if rc == 0:
+                    fork_branch_df_digest = compute_dockerfile_content_digest(fork_dockerfile.encode('utf-8'))
                 else:
                     # It is possible someone has moved the Dockerfile around since we
                     # made the fork.
                     fork_branch_df_digest = 'DOCKERFILE_NOT_FOUND'
 
-                if ci_operator_config_path.exists():
-                    fork_ci_operator_config = yaml.safe_load(
-                        ci_operator_config_path.read_text(encoding='utf-8')
+                rc, fork_ci_operator_yaml, _ = exectools.cmd_gather(
+                    ['git', 'show', f'fork/{fork_branch_name}:./.ci-operator.yaml']
+                )
+                if rc == 0:
+                    fork_ci_operator_config = yaml.load(
+                        fork_ci_operator_yaml, Loader=SafeLoader
                     )  # Read in content from fork
                     fork_ci_build_root_coordinate = fork_ci_operator_config.get('build_root_image', None)
 
             # Now change over to the target branch in the actual public repo
             exectools.cmd_assert(f'git checkout public/{public_branch}')
 
+            assignee = None
+            try:
+                root_owners_path = Dir.getpath().joinpath('OWNERS')
+                if root_owners_path.exists():
+                    parsed_owners = yaml.load(root_owners_path.read_text(), Loader=SafeLoader)
+                    if 'approvers' in parsed_owners and len(parsed_owners['approvers']) > 0:
+                        assignee = random.choice(parsed_owners['approvers'])
+            except Exception as owners_e:
+                yellow_print(f'Error finding assignee in OWNERS for {public_repo_url}: {owners_e}')
+
             try:
                 source_branch_parent_digest, source_branch_parents = extract_parent_digest(df_path)
             except FileNotFoundError:
                 logger.error('%s not found in branch public/%s', df_path, public_branch)
                 errors_raised = True
-                continue
+                return
 
             source_branch_ci_build_root_coordinate = None
             if ci_operator_config_path.exists():
-                source_branch_ci_operator_config = yaml.safe_load(
-                    ci_operator_config_path.read_text(encoding='utf-8')
+                source_branch_ci_operator_config = yaml.load(
+                    ci_operator_config_path.read_text(encoding='utf-8'), Loader=SafeLoader
                 )  # Read in content from public source
                 source_branch_ci_build_root_coordinate = source_branch_ci_operator_config.get('build_root_image', None)
 
@@ -2201,14 +2569,8 @@ Fork build_root (in .ci-operator.yaml): {fork_ci_build_root_coordinate}
                 green_print(
                     'Desired digest and source digest match; desired build_root unset OR coordinates match; Upstream is in a good state'
                 )
-                if fork_branch:
-                    for pr in list(public_source_repo.get_pulls(state='open', head=fork_branch_head)):
-                        if moist_run or dry_run:
-                            yellow_print(f'Would have closed existing PR: {pr.html_url}')
-                        else:
-                            yellow_print(f'Closing unnecessary PR: {pr.html_url}')
-                            pr.edit(state='closed')
-                continue
+                close_unnecessary_prs()
+                return
 
             cardinality_mismatch = False
             if len(desired_parents) != len(source_branch_parents):
@@ -2223,7 +2585,7 @@ Fork build_root (in .ci-operator.yaml): {fork_ci_build_root_coordinate}
             first_commit_line = (
                 f"Updating {image_meta.get_component_name()} image to be consistent with ART for {major}.{minor}"
             )
-            reconcile_url = f'{convert_remote_git_to_https(runtime.gitdata.origin_url)}/tree/{runtime.gitdata.commit_hash}/images/{os.path.basename(image_meta.config_filename)}'
+            reconcile_url = f'{reconcile_url_base}/{os.path.basename(image_meta.config_filename)}'
             reconcile_info = f"Reconciling with {reconcile_url}"
 
             diff_text = None
@@ -2233,44 +2595,57 @@ Fork build_root (in .ci-operator.yaml): {fork_ci_build_root_coordinate}
             # 3. It does exist, and is exactly how we want it.
             # Let's create a local branch that will contain the Dockerfile/.ci-operator.yaml in the state we desire.
             work_branch_name = '__mod'
-            exectools.cmd_assert(f'git checkout public/{public_branch}')
+            # HEAD is still at public/{public_branch} from the checkout above; branch from there directly.
             exectools.cmd_assert(f'git checkout -b {work_branch_name}')
             with df_path.open(mode='r+') as handle:
-                dfp = DockerfileParser(cache_content=True, fileobj=io.BytesIO())
-                dfp.content = handle.read()
-                handle.truncate(0)
-                handle.seek(0)
+                dockerfile_content = handle.read()
                 if not cardinality_mismatch:
-                    dfp.parent_images = desired_parents
+                    try:
+                        dockerfile_content = rewrite_parent_images(dockerfile_content, desired_parents)
+                    except ValueError as e:
+                        # The parent digest extraction and the rewrite disagree on the FROMs; don't propose
+                        # a Dockerfile that may be wrong. The file has not been modified yet.
+                        logger.error('Unable to update FROMs in %s for %s: %s', df_path, public_repo_url, e)
+                        errors_raised = True
+                        return
                 else:
-                    handle.writelines(
-                        [
-                            '# URGENT! ART metadata configuration has a different number of FROMs\n',
-                            '# than this Dockerfile. ART will be unable to build your component or\n',
-                            '# reconcile this Dockerfile until that disparity is addressed.\n',
-                        ]
-                    )
-                handle.write(dfp.content)
+                    dockerfile_content = (
+                        '# URGENT! ART metadata configuration has a different number of FROMs\n'
+                        '# than this Dockerfile. ART will be unable to build your component or\n'
+                        '# reconcile this Dockerfile until that disparity is addressed.\n'
+                    ) + dockerfile_content
+                handle.truncate(0)
+                handle.seek(0)
+                handle.write(dockerfile_content)
+                # The desired content is already in memory; hash it rather than reading the file back.
+                desired_df_digest = compute_dockerfile_content_digest(dockerfile_content.encode(handle.encoding))
 
-            exectools.cmd_assert(f'git add {str(df_path)}')
+            # Paths to stage for the reconciliation commit, added with a single git invocation.
+            # -f because .ci-operator.yaml may be ignored; the Dockerfile is tracked, so it is unaffected.
+            paths_to_add = [str(df_path)]
 
             if desired_ci_build_root_coordinate:
                 if ci_operator_config_path.exists():
-                    ci_operator_config = yaml.safe_load(ci_operator_config_path.read_text(encoding='utf-8'))
+                    ci_operator_config = yaml.load(
+                        ci_operator_config_path.read_text(encoding='utf-8'), Loader=SafeLoader
+                    )
                 else:
                     ci_operator_config = {}
 
                 # Overwrite the existing build_root_image if it exists. Preserve any other settings.
                 ci_operator_config['build_root_image'] = desired_ci_build_root_coordinate
                 with ci_operator_config_path.open(mode='w+', encoding='utf-8') as config_file:
-                    yaml.safe_dump(ci_operator_config, config_file, default_flow_style=False)
+                    yaml.dump(ci_operator_config, config_file, Dumper=SafeDumper, default_flow_style=False)
 
-                exectools.cmd_assert(f'git add -f {str(ci_operator_config_path)}')
+                paths_to_add.append(str(ci_operator_config_path))
 
-            desired_df_digest = compute_dockerfile_digest(df_path)
+            exectools.cmd_assert(['git', 'add', '-f', '--'] + paths_to_add)
 
-            # Check for any existing open PR
-            open_prs = list(public_source_repo.get_pulls(state='open', head=fork_branch_head))
+            # Check for any existing open PR. GitHub closes a PR when its head branch is deleted, so there
+            # is nothing to look up if the fork branch does not exist.
+            open_prs = []
+            if fork_branch:
+                open_prs = get_open_prs(public_source_repo, fork_branch_name)
 
             logger.info(f'''
 Desired Dockerfile digest: {desired_df_digest}
@@ -2287,7 +2662,6 @@ open_prs: {open_prs}
             # So... to prevent this, if there is no open PR, we should force push to the fork branch to make its
             # commit something different than what is in the public branch.
 
-            diff_text, _ = exectools.cmd_assert('git diff HEAD', strip=True)
             if (
                 desired_df_digest != fork_branch_df_digest
                 or (
@@ -2297,6 +2671,7 @@ open_prs: {open_prs}
                 or not open_prs
             ):
                 yellow_print('Found that fork branch is not in sync with public Dockerfile/.ci-operator.yaml changes')
+                diff_text, _ = exectools.cmd_assert('git diff HEAD', strip=True)
                 yellow_print(diff_text)
 
                 if not moist_run and not dry_run:
@@ -2388,30 +2763,42 @@ __Change behavior of future PRs__:
 If you have any questions about this pull request, please reach out in the `#forum-ocp-art` Slack channel.
 """
 
-            parent_pr_urls = None
-            parent_meta = image_meta.resolve_parent()
+            parent_pr_url = None
+            parent_meta = parent_metas[dgk]
             if parent_meta:
+                if parent_meta.distgit_key in reconciled:
+                    reconciled[parent_meta.distgit_key].wait()
+
                 if parent_meta.distgit_key in skipping_dgks:
-                    skipping_dgks.add(image_meta.distgit_key)
+                    with results_lock:
+                        skipping_dgks.add(image_meta.distgit_key)
                     yellow_print(
                         f'Image has parent {parent_meta.distgit_key} which was skipped; skipping self: {image_meta.distgit_key}'
                     )
-                    continue
+                    return
 
-                parent_pr_urls = pr_dgk_map.get(parent_meta.distgit_key, None)
-                if parent_pr_urls:
+                parent_pr = pr_dgk_map.get(parent_meta.distgit_key, None)
+                if parent_pr:
+                    parent_pr_url = parent_pr[0].html_url
                     if parent_meta.config.content.source.ci_alignment.streams_prs.merge_first:
-                        skipping_dgks.add(image_meta.distgit_key)
+                        with results_lock:
+                            skipping_dgks.add(image_meta.distgit_key)
                         yellow_print(
-                            f'Image has parent {parent_meta.distgit_key} open PR ({parent_pr_urls[0]}) and streams_prs.merge_first==True; skipping PR opening for this image {image_meta.distgit_key}'
+                            f'Image has parent {parent_meta.distgit_key} open PR ({parent_pr_url}) and streams_prs.merge_first==True; skipping PR opening for this image {image_meta.distgit_key}'
                         )
-                        continue
+                        return
 
                     # If the parent has an open PR associated with it, make sure the
                     # child PR notes that the parent PR should merge first.
-                    pr_body += (
-                        f'\nDepends on {parent_pr_urls[0]} . Allow it to merge and then run `/test all` on this PR.'
-                    )
+                    pr_body += f'\nDepends on {parent_pr_url} . Allow it to merge and then run `/test all` on this PR.'
+
+            # Labels to add to the new or existing PR, applied in a single request.
+            pr_labels = []
+            if streams_pr_config.auto_label and add_auto_labels:
+                # If we are to automatically add labels to this upstream PR, do so.
+                pr_labels.extend(streams_pr_config.auto_label)
+            if add_label:
+                pr_labels.extend(add_label)
 
             jenkins_build_url = None
             if open_prs:
@@ -2421,17 +2808,14 @@ If you have any questions about this pull request, please reach out in the `#for
 
                 if not dry_run:
                     try:
-                        if streams_pr_config.auto_label and add_auto_labels:
-                            # If we are to automatically add labels to this upstream PR, do so.
-                            existing_pr.add_to_labels(*streams_pr_config.auto_label)
-
-                        if add_label:
-                            existing_pr.add_to_labels(*add_label)
+                        if pr_labels:
+                            existing_pr.add_to_labels(*pr_labels)
                     except GithubException as pr_e:
                         # We are not admin on all repos
                         yellow_print(f'Unable to add labels to {existing_pr.html_url}: {str(pr_e)}')
 
-                pr_dgk_map[dgk] = (existing_pr, jenkins_build_url)
+                with results_lock:
+                    pr_dgk_map[dgk] = (existing_pr, jenkins_build_url)
 
                 # The pr_body may change and the base branch may change (i.e. at branch cut,
                 # a version 4.6 in master starts being tracked in release-4.6 and master tracks
@@ -2461,7 +2845,7 @@ If you have any questions about this pull request, please reach out in the `#for
                     if force_merge:
                         existing_pr.merge()
                         yellow_print(f'Force merge is enabled. Triggering merge for: {existing_pr.html_url}')
-                continue
+                return
 
             # Otherwise, we need to create a pull request
             if moist_run or dry_run:
@@ -2471,8 +2855,11 @@ If you have any questions about this pull request, please reach out in the `#for
                 yellow_print('PR body would have been:')
                 yellow_print(pr_body)
 
-                if parent_pr_urls:
-                    green_print(f'Would have identified dependency on PR: {parent_pr_urls[0]}.')
+                if parent_pr_url:
+                    green_print(f'Would have identified dependency on PR: {parent_pr_url}.')
+                if diff_text is None:
+                    # The diff is only computed up front when the fork branch has to be updated.
+                    diff_text, _ = exectools.cmd_assert('git diff HEAD', strip=True)
                 if diff_text:
                     yellow_print('PR diff would have been:')
                     yellow_print(diff_text)
@@ -2484,43 +2871,65 @@ If you have any questions about this pull request, please reach out in the `#for
                 pr_title = first_commit_line
                 if bug:
                     pr_title = f'Bug {bug}: {pr_title}'
-                try:
-                    new_pr = public_source_repo.create_pull(
-                        title=pr_title, body=pr_body, base=public_branch, head=fork_branch_head, draft=draft_prs
-                    )
-                    jenkins_build_url = jenkins.get_build_url()
-                    if jenkins_build_url:
-                        new_pr.create_issue_comment(f"Created by ART pipeline job run {jenkins_build_url}")
-
-                except GithubException as ge:
-                    if 'already exists' in json.dumps(ge.data):
-                        # In one execution to date, get_pulls did not find the open PR and the code repeatedly hit this
-                        # branch -- attempting to recreate the PR. Everything seems right, but the github api is not
-                        # returning it. So catch the error and try to move on.
-                        yellow_print(
-                            'Issue attempting to find it, but a PR is already open requesting desired reconciliation with ART'
+                # PRs are opened one at a time across all workers, at least interstitial seconds apart.
+                # Workers with nothing to open never wait.
+                with pr_creation_lock:
+                    wait = interstitial - (time.monotonic() - last_pr_created_at)
+                    if last_pr_created_at and wait > 0:
+                        print(f'Sleeping {wait:.0f} seconds before opening another PR to prevent flooding prow...')
+                        time.sleep(wait)
+                    try:
+                        new_pr = public_source_repo.create_pull(
+                            title=pr_title, body=pr_body, base=public_branch, head=fork_branch_head, draft=draft_prs
                         )
-                        continue
-                    raise
+                    except GithubException as ge:
+                        if is_pr_already_exists_error(ge):
+                            # In one execution to date, get_pulls did not find the open PR and the code repeatedly hit this
+                            # branch -- attempting to recreate the PR. Everything seems right, but the github api is not
+                            # returning it. So catch the error and try to move on.
+                            yellow_print(
+                                'Issue attempting to find it, but a PR is already open requesting desired reconciliation with ART'
+                            )
+                            return
+                        raise
+                    last_pr_created_at = time.monotonic()
 
-                try:
-                    if streams_pr_config.auto_label and add_auto_labels:
-                        # If we are to automatically add labels to this upstream PR, do so.
-                        new_pr.add_to_labels(*streams_pr_config.auto_label)
+                invalidate_open_prs(public_source_repo)
+                jenkins_build_url = jenkins.get_build_url()
+                if jenkins_build_url:
+                    new_pr.create_issue_comment(f"Created by ART pipeline job run {jenkins_build_url}")
 
-                    if add_label:
-                        new_pr.add_to_labels(*add_label)
+                try:
+                    if pr_labels:
+                        new_pr.add_to_labels(*pr_labels)
                 except GithubException as pr_e:
                     # We are not admin on all repos
-                    yellow_print(f'Unable to add labels to {existing_pr.html_url}: {str(pr_e)}')
+                    yellow_print(f'Unable to add labels to {new_pr.html_url}: {str(pr_e)}')
 
                 pr_msg = f'A new PR has been opened: {new_pr.html_url}'
-                pr_dgk_map[dgk] = (new_pr, jenkins_build_url)
-                new_pr_links[dgk] = new_pr.html_url
+                with results_lock:
+                    pr_dgk_map[dgk] = (new_pr, jenkins_build_url)
+                    new_pr_links[dgk] = new_pr.html_url
                 logger.info(pr_msg)
                 yellow_print(pr_msg)
-                print(f'Sleeping {interstitial} seconds before opening another PR to prevent flooding prow...')
-                time.sleep(interstitial)
+
+    def reconcile_image_and_signal(image_meta: ImageMetadata):
+        nonlocal errors_raised
+        try:
+            reconcile_image(image_meta)
+        except Exception:
+            # Other images keep reconciling; report the failure once the summary and Jira updates are done.
+            image_meta.logger.exception('Error reconciling image')
+            errors_raised = True
+        finally:
+            # Release any children waiting on this image, even if it failed.
+            reconciled[image_meta.distgit_key].set()
+
+    exectools.parallel_exec(
+        lambda image_meta, _: reconcile_image_and_signal(image_meta),
+        runtime.ordered_image_metas(),
+        n_threads=reconcile_threads,
+    ).get()
 
     if new_pr_links:
         print('Newly opened PRs:')
@@ -1,14 +1,17 @@
 import asyncio
+import functools
 import hashlib
 import json
 import logging
 import os
 import sys
 import traceback
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple, cast
 from unittest.mock import MagicMock
 
 import aiofiles
@@ -35,9 +38,10 @@ from artcommonlib.util import (
     get_art_prod_image_repo_for_version,
     uses_konflux_imagestream_override,
 )
+from artcommonlib.yaml_util import SafeDumper
 from elliottlib.util import chunk
 from opentelemetry import trace
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential, wait_fixed
 
 from doozerlib.assembly_inspector import AssemblyInspector
 from doozerlib.brew import KojiWrapperMetaReturn
@@ -394,7 +398,8 @@ async def modify_and_replace_api_object(
         api_obj.replace()
 
 
-class PayloadEntry(NamedTuple):
+@dataclass(slots=True)
+class PayloadEntry:
     # Append any issues for the assembly
     issues: List[AssemblyIssue]
 
@@ -495,6 +500,8 @@ class GenPayloadCli:
         # Track mismatched siblings.
         # This will be used to prevent syncing out mismatched siblings for development releases per ART-13996
         self.mismatched_siblings = []
+        # Reference nightly comparison, started early so it overlaps payload entry generation
+        self.nightlies_consistency_task: Optional[asyncio.Task] = None
 
     @start_as_current_span_async(TRACER, "releases:gen-payload")
     async def run(self):
@@ -548,28 +555,42 @@ class GenPayloadCli:
             assembly_inspector = AssemblyInspector(rt, rt.build_retrying_koji_client())
             await assembly_inspector.initialize(lookup_mode='both')
 
-        self.payload_entries_for_arch, self.private_payload_entries_for_arch = await self.generate_payload_entries(
-            assembly_inspector
-        )
+        if not self.multi_model:
+            # Comparing against reference nightlies only needs the assembly's builds, not the payload entries
+            # generated below, so run the nightly lookups concurrently with them. The issues are collected with
+            # the rest of the assembly report.
+            self.nightlies_consistency_task = asyncio.create_task(
+                self.payload_generator.check_nightlies_consistency(assembly_inspector)
+            )
 
-        if self.multi_model:
-            # The model nightly already passed consistency checks in regular build-sync;
-            # re-running them here is expensive and can flake without adding value.
-            self.payload_permitted = True
-            assembly_report: Dict = dict(
-                non_release_images=[m.distgit_key for m in rt.get_non_release_image_metas()],
-                release_images=[m.distgit_key for m in rt.get_for_release_image_metas()],
-                missing_image_builds=[],
-                viable=True,
-                assembly_issues={},
+        try:
+            self.payload_entries_for_arch, self.private_payload_entries_for_arch = await self.generate_payload_entries(
+                assembly_inspector
             )
-            self.logger.info("Multi-model mode: skipping assembly consistency checks")
-        else:
-            assembly_report: Dict = await self.generate_assembly_report(assembly_inspector)
 
-        self.logger.info('\n%s', yaml.dump(assembly_report, default_flow_style=False, indent=2))
-        with self.output_path.joinpath("assembly-report.yaml").open(mode="w") as report_file:
-            yaml.dump(assembly_report, stream=report_file, default_flow_style=False, indent=2)
+            if self.multi_model:
+                # The model nightly already passed consistency checks in regular build-sync;
+                # re-running them here is expensive and can flake without adding value.
+                self.payload_permitted = True
+                assembly_report: Dict = dict(
+                    non_release_images=[m.distgit_key for m in rt.get_non_release_image_metas()],
+                    release_images=[m.distgit_key for m in rt.get_for_release_image_metas()],
+                    missing_image_builds=[],
+                    viable=True,
+                    assembly_issues={},
+                )
+                self.logger.info("Multi-model mode: skipping assembly consistency checks")
+            else:
+                assembly_report: Dict = await self.generate_assembly_report(assembly_inspector)
+        finally:
+            # The nightly comparison is normally awaited while generating the assembly report; make sure
+            # its lookups don't outlive the run if something failed before then.
+            await self._finish_nightlies_consistency_task()
+
+        # Serialize once; the same text is logged and written out in a single write
+        assembly_report_yaml = yaml.dump(assembly_report, Dumper=SafeDumper, default_flow_style=False, indent=2)
+        self.logger.info('\n%s', assembly_report_yaml)
+        self.output_path.joinpath("assembly-report.yaml").write_text(assembly_report_yaml)
         span.set_attribute("doozer.result.report", assembly_report)
 
         self.assess_assembly_viability()
@@ -583,6 +604,18 @@ class GenPayloadCli:
         )
         exit(1)
 
+    async def _finish_nightlies_consistency_task(self):
+        """
+        Cancel the reference nightly comparison if it is still running and retrieve its outcome, so an
+        error elsewhere neither leaves its oc calls running nor leaves its exception unretrieved.
+        """
+        task = self.nightlies_consistency_task
+        if not task:
+            return
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
     async def _create_assembly_from_model(self, multi_model_nightly: str) -> Dict:
         """
         Use gen-assembly logic to create an assembly definition from a multi-model nightly.
@@ -836,7 +869,9 @@ class GenPayloadCli:
             with rt.shared_build_status_detector() as bsd:
                 # Use the list of builds associated with the group/assembly to warm up BSD caches
                 assembly_build_ids: Set[int] = self.collect_assembly_build_ids(assembly_inspector)
-                assembly_brew_build_ids = list(filter(lambda build_id: str(build_id).isdigit(), assembly_build_ids))
+                assembly_brew_build_ids: Set[int] = {
+                    build_id for build_id in assembly_build_ids if str(build_id).isdigit()
+                }
                 bsd.populate_archive_lists(assembly_brew_build_ids)
                 bsd.find_shipped_builds(assembly_brew_build_ids)
 
@@ -860,7 +895,10 @@ class GenPayloadCli:
         await self.detect_extend_payload_entry_issues(assembly_inspector)
 
         # If the assembly claims to have reference nightlies, assert that our payload matches them exactly.
-        self.assembly_issues.extend(await self.payload_generator.check_nightlies_consistency(assembly_inspector))
+        nightlies_consistency = self.nightlies_consistency_task or self.payload_generator.check_nightlies_consistency(
+            assembly_inspector
+        )
+        self.assembly_issues.extend(await nightlies_consistency)
 
         span.add_event("Summarizing assembly issue permits")
         return self.summarize_issue_permits(assembly_inspector)
@@ -919,7 +957,7 @@ class GenPayloadCli:
 
         # Build a map of normalized source URL -> list of (distgit_key, source_commit) from payload images.
         # Multiple images can share the same upstream repo, so we store all of them.
-        image_source_commits: Dict[str, List[Tuple[str, str]]] = {}
+        image_source_commits: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
         for img in assembly_inspector.get_group_release_images().values():
             if not img or not img.get_image_meta().is_payload:
                 continue
@@ -929,9 +967,7 @@ class GenPayloadCli:
             if not source_url or not source_commit:
                 continue
             normalized_url = convert_remote_git_to_https(source_url)
-            image_source_commits.setdefault(normalized_url, []).append(
-                (img.get_image_meta().distgit_key, source_commit)
-            )
+            image_source_commits[normalized_url].append((img.get_image_meta().distgit_key, source_commit))
 
         # Check each RPM's source against the image map
         issues = []
@@ -1034,7 +1070,7 @@ class GenPayloadCli:
             self.tag_missing_gc_tags(id_tags)
 
         # we should now in good conscience be able to put these in a payload
-        return set(build_id for build_id, _ in id_tags)
+        return {build_id for build_id, _ in id_tags}
 
     def tag_missing_gc_tags(self, id_tags: Tuple[int, str]):
         """
@@ -1181,91 +1217,129 @@ class GenPayloadCli:
             self.runtime.group_config.konflux.arches if self.runtime.build_system == 'konflux' else self.runtime.arches
         )
 
+        included_arches = []
         for arch in arches:
             if arch in self.exclude_arch:
                 self.logger.info(f"Excluding payload files architecture: {arch}")
                 continue
-            # No adjustment for private or public; the assembly's canonical payload content is the same.
-
-            entries: Dict[str, PayloadEntry]  # Key of this dict is release payload tag name
-            payload_issues: List[AssemblyIssue]
-            public_repo = self.full_component_repo(repo_type=RepositoryType.PUBLIC)
-            entries, payload_issues = self.payload_generator.find_payload_entries(
-                assembly_inspector, arch, public_repo, registry_config=registry_config
-            )
+            included_arches.append(arch)
+
+        # Each arch is dominated by Brew/registry round trips, so look them up concurrently and merge the
+        # results in arch order to keep the assembly issues deterministic.
+        results = await asyncio.gather(
+            *[
+                self._generate_arch_payload_entries(assembly_inspector, arch, registry_config)
+                for arch in included_arches
+            ]
+        )
+        for arch, (public_entries, private_entries, arch_issues) in zip(included_arches, results):
+            public_entries_for_arch[arch] = public_entries
+            private_entries_for_arch[arch] = private_entries
+            self.assembly_issues.extend(arch_issues)
 
-            public_entries: Dict[str, PayloadEntry] = dict()
-            for k, v in entries.items():
-                if not v.build_record_inspector:
-                    # Its RHCOS, since it doesn't have a build inspector. Put it in for now, but change once RHCOS
-                    # supports private nightlies
-                    public_entries[k] = v
-                    continue
+        return public_entries_for_arch, private_entries_for_arch
 
-                if v.build_record_inspector.is_under_embargo() and self.runtime.assembly_type == AssemblyTypes.STREAM:
-                    if self.runtime.build_system == 'brew':
-                        public_build = v.image_meta.get_latest_brew_build(
-                            default=None, el_target=v.image_meta.branch_el_target(), extra_pattern='*.p0.*'
-                        )
-                    else:
-                        public_build = await v.image_meta.get_latest_konflux_build(
-                            default=None, el_target=v.image_meta.branch_el_target(), embargoed=False
-                        )
+    async def _generate_arch_payload_entries(
+        self, assembly_inspector: AssemblyInspector, arch: str, registry_config: Optional[str]
+    ) -> Tuple[Dict[str, PayloadEntry], Dict[str, PayloadEntry], List[AssemblyIssue]]:
+        """
+        Generate the public and private single-arch PayloadEntries for one architecture.
+        Returns (public entries, private entries, assembly issues found for the arch).
+        """
+        # No adjustment for private or public; the assembly's canonical payload content is the same.
 
-                    if not public_build:
-                        raise IOError(f'Unable to find last public build for {v.image_meta.distgit_key}')
+        entries: Dict[str, PayloadEntry]  # Key of this dict is release payload tag name
+        payload_issues: List[AssemblyIssue]
+        public_repo = self.full_component_repo(repo_type=RepositoryType.PUBLIC)
+        entries, payload_issues = await exectools.to_thread(
+            self.payload_generator.find_payload_entries,
+            assembly_inspector,
+            arch,
+            public_repo,
+            registry_config=registry_config,
+        )
 
-                    public_bbi = BuildRecordInspector.get_build_record_inspector(
-                        runtime=self.runtime, build_obj=public_build
-                    )
-                    public_image_inspector = public_bbi.get_image_inspector(arch)
+        public_entries: Dict[str, PayloadEntry] = dict()
+        for k, v in entries.items():
+            if not v.build_record_inspector:
+                # Its RHCOS, since it doesn't have a build inspector. Put it in for now, but change once RHCOS
+                # supports private nightlies
+                public_entries[k] = v
+                continue
 
-                    dest_pullspec = self.payload_generator.get_mirroring_destination(
-                        public_image_inspector.get_digest(), public_repo
-                    )
-                    dest_manifest_list_pullspec = self.payload_generator.get_mirroring_destination(
-                        public_image_inspector.get_manifest_list_digest(), public_repo
+            if v.build_record_inspector.is_under_embargo() and self.runtime.assembly_type == AssemblyTypes.STREAM:
+                if self.runtime.build_system == 'brew':
+                    public_build = await exectools.to_thread(
+                        v.image_meta.get_latest_brew_build,
+                        default=None,
+                        el_target=v.image_meta.branch_el_target(),
+                        extra_pattern='*.p0.*',
                     )
-                    public_entry = PayloadEntry(
-                        image_meta=v.image_meta,
-                        build_record_inspector=public_bbi,
-                        image_inspector=public_image_inspector,
-                        dest_pullspec=dest_pullspec,
-                        dest_manifest_list_pullspec=dest_manifest_list_pullspec,
-                        issues=list(),
+                else:
+                    public_build = await v.image_meta.get_latest_konflux_build(
+                        default=None, el_target=v.image_meta.branch_el_target(), embargoed=False
                     )
 
-                    self.logger.info(
-                        f'Replacing embargoed image {v.build_record_inspector.get_nvr()} with public image {public_bbi.get_nvr()} for public imagestream'
-                    )
-                    public_entries[k] = public_entry
-                    # It's an embargoed build. Filter it out if its stream
-                    continue
+                if not public_build:
+                    raise IOError(f'Unable to find last public build for {v.image_meta.distgit_key}')
 
-                public_entries[k] = v
+                public_bbi = BuildRecordInspector.get_build_record_inspector(
+                    runtime=self.runtime, build_obj=public_build
+                )
+                public_image_inspector = public_bbi.get_image_inspector(arch)
 
-            public_entries_for_arch[arch] = public_entries
-            self.assembly_issues.extend(payload_issues)
-
-            # Report issues for any embargoed content being made public.
-            # If releasing after embargo lift, these can be permitted using 'EMBARGOED_CONTENT' code
-            embargo_issues = self.payload_generator.embargo_issues_for_payload(public_entries, arch)
-            self.assembly_issues.extend(embargo_issues)
-
-            private_entries, private_payload_issues = self.payload_generator.find_payload_entries(
-                assembly_inspector,
-                arch,
-                self.full_component_repo(repo_type=RepositoryType.PRIVATE),
-                registry_config=registry_config,
-            )
-            private_entries_for_arch[arch] = private_entries
+                dest_pullspec = self.payload_generator.get_mirroring_destination(
+                    public_image_inspector.get_digest(), public_repo
+                )
+                dest_manifest_list_pullspec = self.payload_generator.get_mirroring_destination(
+                    public_image_inspector.get_manifest_list_digest(), public_repo
+                )
+                public_entry = PayloadEntry(
+                    image_meta=v.image_meta,
+                    build_record_inspector=public_bbi,
+                    image_inspector=public_image_inspector,
+                    dest_pullspec=dest_pullspec,
+                    dest_manifest_list_pullspec=dest_manifest_list_pullspec,
+                    issues=list(),
+                )
 
-            # Check to see if there are private only issues, and add them to the list of assembly issues
-            private_only_issues = set(private_payload_issues) - set(payload_issues)
+                self.logger.info(
+                    f'Replacing embargoed image {v.build_record_inspector.get_nvr()} with public image {public_bbi.get_nvr()} for public imagestream'
+                )
+                public_entries[k] = public_entry
+                # It's an embargoed build. Filter it out if its stream
+                continue
 
-            self.assembly_issues.extend(list(private_only_issues))
+            public_entries[k] = v
 
-        return public_entries_for_arch, private_entries_for_arch
+        arch_issues: List[AssemblyIssue] = list(payload_issues)
+
+        # Report issues for any embargoed content being made public.
+        # If releasing after embargo lift, these can be permitted using 'EMBARGOED_CONTENT' code
+        embargo_issues = self.payload_generator.embargo_issues_for_payload(public_entries, arch)
+        arch_issues.extend(embargo_issues)
+
+        private_entries, private_payload_issues = await exectools.to_thread(
+            self.payload_generator.find_payload_entries,
+            assembly_inspector,
+            arch,
+            self.full_component_repo(repo_type=RepositoryType.PRIVATE),
+            registry_config=registry_config,
+        )
+
+        # Check to see if there are private only issues, and add them to the list of assembly issues.
+        # AssemblyIssue does not define equality, so compare on content rather than identity; otherwise
+        # every issue found by both passes would be recorded twice.
+        public_issue_keys = {(issue.code, issue.component, issue.msg) for issue in payload_issues}
+        private_only_issues = [
+            issue
+            for issue in private_payload_issues
+            if (issue.code, issue.component, issue.msg) not in public_issue_keys
+        ]
+
+        arch_issues.extend(private_only_issues)
+
+        return public_entries, private_entries, arch_issues
 
     @start_as_current_span_async(TRACER, "GenPayloadCli.detect_extend_payload_entry_issues")
     async def detect_extend_payload_entry_issues(self, assembly_inspector: AssemblyInspector):
@@ -1279,18 +1353,32 @@ class GenPayloadCli:
         cross_payload_requirements = self.runtime.group_config.rhcos.require_consistency
         if not cross_payload_requirements:
             self.runtime.logger.debug("No cross-payload consistency requirements defined in group.yml")
+        # Looked up once rather than for every RHCOS entry of every arch
+        group_release_images = assembly_inspector.get_group_release_images() if cross_payload_requirements else None
         # Structure to record rhcos builds we use so that they can be analyzed for inconsistencies
         targeted_rhcos_builds: Dict[bool, List[RHCOSBuildInspector]] = {
             False: [],
             True: [],
         }  # privacy mode: list of BuildInspector
+
+        # Index assembly issues by component rather than scanning every issue for every entry of every arch.
+        # assembly_issues only grows while we walk the entries (RHCOS checks append to it), so newly appended
+        # issues are folded into the index before each lookup.
+        issues_by_component: Dict[str, List[AssemblyIssue]] = defaultdict(list)
+        indexed_issue_count = 0
+
+        def issues_for_component(component: str) -> List[AssemblyIssue]:
+            nonlocal indexed_issue_count
+            for ai in self.assembly_issues[indexed_issue_count:]:
+                issues_by_component[ai.component].append(ai)
+            indexed_issue_count = len(self.assembly_issues)
+            return issues_by_component.get(component, [])
+
         for arch, entries in self.payload_entries_for_arch.items():
             for tag, payload_entry in entries.items():
                 if payload_entry.image_meta:
                     # Record the issues previously found for this image in corresponding payload_entry
-                    payload_entry.issues.extend(
-                        ai for ai in self.assembly_issues if ai.component == payload_entry.image_meta.distgit_key
-                    )
+                    payload_entry.issues.extend(issues_for_component(payload_entry.image_meta.distgit_key))
                 elif payload_entry.rhcos_build:
                     if tag != primary_container_name:
                         continue  # RHCOS is one build, only analyze once (for primary container)
@@ -1304,7 +1392,7 @@ class GenPayloadCli:
                         self.assembly_issues.extend(
                             self.payload_generator.find_rhcos_payload_rpm_inconsistencies(
                                 payload_entry.rhcos_build,
-                                assembly_inspector.get_group_release_images(),
+                                group_release_images,
                                 cross_payload_requirements,
                                 self.package_rpm_finder,
                             ),
@@ -1369,7 +1457,7 @@ class GenPayloadCli:
         """
         permitted_non_acknowledged_embargoed_issues = []
         payload_permitted = True
-        assembly_issues_report: Dict[str, List[Dict]] = dict()
+        assembly_issues_report: Dict[str, List[Dict]] = defaultdict(list)
         for ai in self.assembly_issues:
             permitted = assembly_inspector.does_permit(ai)
 
@@ -1385,7 +1473,7 @@ class GenPayloadCli:
                     permitted_non_acknowledged_embargoed_issues.append(ai.component)
 
             payload_permitted &= permitted  # If anything not permitted, payload not permitted
-            assembly_issues_report.setdefault(ai.component, []).append(
+            assembly_issues_report[ai.component].append(
                 dict(
                     code=ai.code.name,
                     msg=ai.msg,
@@ -1399,7 +1487,8 @@ class GenPayloadCli:
                 "must specify --embargo-permit-ack flag to publish private content"
             )
 
-        return payload_permitted, assembly_issues_report
+        # Hand back a plain dict; the report is serialized with SafeDumper, which cannot represent a defaultdict
+        return payload_permitted, dict(assembly_issues_report)
 
     @TRACER.start_as_current_span("GenPayloadCli.assess_assembly_viability")
     def assess_assembly_viability(self):
@@ -1539,9 +1628,11 @@ class GenPayloadCli:
         @retry(reraise=True, stop=stop_after_attempt(10), wait=wait_fixed(60))
         async def _mirror(file_path: Path, dest_src_pullspecs: List[Tuple[str, str]]):
             # Save the default SRC=DEST input to a file for syncing by 'oc image mirror'
+            # Every aiofiles write is a round trip to a worker thread, so write the whole file at once.
             async with aiofiles.open(file_path, mode="w+", encoding="utf-8") as out_file:
-                for dest_pullspec, src_pullspec in dest_src_pullspecs:
-                    await out_file.write(f"{src_pullspec}={dest_pullspec}\n")
+                await out_file.write(
+                    "".join(f"{src_pullspec}={dest_pullspec}\n" for dest_pullspec, src_pullspec in dest_src_pullspecs)
+                )
 
             if self.apply or self.apply_multi_arch:
                 self.logger.info(f"Mirroring images from {str(src_dest_path)}")
@@ -1590,12 +1681,19 @@ class GenPayloadCli:
             # performing a full replacement of the imagestream content.
             incomplete_payload_update = True
 
+        is_stream = self.runtime.assembly_type == AssemblyTypes.STREAM
+        # Only public stream imagestreams exclude embargoed builds
+        exclude_embargoed = is_stream and private_mode is False
+
+        # Note that istags are built per imagestream even when the public and private payloads share a
+        # PayloadEntry: apply_imagestream_update rewrites istags in place to honor TRT reverts, so the
+        # dicts must not be shared between imagestreams.
         for payload_tag_name, payload_entry in payload_entries.items():
             # Skip mismatched siblings - they were not mirrored and should not be in the imagestream
             if (
-                payload_entry.image_meta
+                is_stream
+                and payload_entry.image_meta
                 and payload_entry.image_meta.distgit_key in self.mismatched_siblings
-                and self.runtime.assembly_type == AssemblyTypes.STREAM
             ):
                 self.logger.warning(
                     f"Skipping imagestream tag for {payload_entry.image_meta.distgit_key} "
@@ -1605,10 +1703,9 @@ class GenPayloadCli:
                 continue
 
             if (
-                private_mode is False
+                exclude_embargoed
                 and payload_entry.build_record_inspector
                 and payload_entry.build_record_inspector.is_under_embargo()
-                and self.runtime.assembly_type == AssemblyTypes.STREAM
             ):
                 # No embargoed images for assembly stream
                 # should go to the public release controller, so we will not have
@@ -1643,7 +1740,7 @@ class GenPayloadCli:
 
         filename = (
             f"updated-tags-for.{imagestream_namespace}.{imagestream_name}"
-            f"{'-partial' if incomplete_payload_update else ''}.yaml"
+            f"{'-partial' if incomplete_payload_update else ''}.json"
         )
         async with aiofiles.open(self.output_path.joinpath(filename), mode="w+", encoding="utf-8") as out_file:
             istream_spec = self.payload_generator.build_payload_imagestream(
@@ -1652,7 +1749,7 @@ class GenPayloadCli:
                 istags,
                 self.assembly_issues,
             )
-            await out_file.write(yaml.safe_dump(istream_spec, indent=2, default_flow_style=False))
+            await out_file.write(json.dumps(istream_spec, indent=2) + '\n')
 
     async def apply_arch_imagestream(
         self, imagestream_namespace: str, imagestream_name: str, istags: List[Dict], incomplete_payload_update: bool
@@ -2034,7 +2131,9 @@ class GenPayloadCli:
 
         # write the manifest list to a file and push it to the registry.
         async with aiofiles.open(component_manifest_path, mode="w+") as ml:
-            await ml.write(yaml.safe_dump(dict(image=output_pullspec, manifests=manifests), default_flow_style=False))
+            await ml.write(
+                yaml.dump(dict(image=output_pullspec, manifests=manifests), Dumper=SafeDumper, default_flow_style=False)
+            )
         await manifest_tool(f'push from-spec {str(component_manifest_path)}', auth_file=self.runtime.registry_config)
 
         # we are pushing a new manifest list, so return its sha256 based pullspec
@@ -2058,10 +2157,10 @@ class GenPayloadCli:
         """
 
         # Write the imagestream to a file ("oc adm release new" can read from a file instead of
-        # openshift cluster API)
-        multi_release_is_path: Path = self.output_path.joinpath(f"{imagestream_name}-release-imagestream.yaml")
+        # openshift cluster API). The file is only read by oc, so write JSON, which is much cheaper to emit.
+        multi_release_is_path: Path = self.output_path.joinpath(f"{imagestream_name}-release-imagestream.json")
         async with aiofiles.open(multi_release_is_path, mode="w+") as mf:
-            await mf.write(yaml.safe_dump(multi_release_is))
+            await mf.write(json.dumps(multi_release_is, indent=2))
 
         @retry(reraise=True, stop=stop_after_attempt(10), wait=wait_fixed(60))
         async def _run(to_image, to_image_base):
@@ -2131,7 +2230,7 @@ class GenPayloadCli:
 
         release_payload_ml_path = self.output_path.joinpath(f"{imagestream_name}.manifest-list.yaml")
         async with aiofiles.open(release_payload_ml_path, mode="w+") as ml:
-            await ml.write(yaml.safe_dump(ml_dict, default_flow_style=False))
+            await ml.write(yaml.dump(ml_dict, Dumper=SafeDumper, default_flow_style=False))
 
         await manifest_tool(f'push from-spec {str(release_payload_ml_path)}', auth_file=self.runtime.registry_config)
 
@@ -2275,10 +2374,100 @@ class GenPayloadCli:
         )
 
 
+# Cached release info is only trusted for a day: nightlies are garbage collected after a while, and a stale
+# entry would hide that the reference nightly no longer exists.
+_RELEASE_INFO_CACHE_TTL = timedelta(days=1)
+
+
+def _release_info_cache_file(cache_dir: str, pullspec: str) -> Path:
+    return Path(cache_dir, "release-info", f"{hashlib.sha256(pullspec.encode()).hexdigest()}.json")
+
+
+def _prune_release_info_cache(cache_path: Path, logger: logging.Logger):
+    """
+    Removes cached release info older than _RELEASE_INFO_CACHE_TTL.
+    """
+    cutoff = (datetime.now() - _RELEASE_INFO_CACHE_TTL).timestamp()
+    for cached in cache_path.glob("*.json"):
+        try:
+            if cached.stat().st_mtime < cutoff:
+                cached.unlink()
+        except OSError:
+            logger.debug(f"Unable to prune cached release info {cached}", exc_info=True)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=5),
+    retry=retry_if_result(lambda result: result[0] != 0),
+    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+)
+async def _gather_release_info(cmd: List[str], logger: logging.Logger) -> Tuple[int, str, str]:
+    """
+    Runs `oc adm release info`, backing off between failed attempts.
+    :return: (rc, stdout, stderr) of the last attempt.
+    """
+    rc, out, err = await exectools.cmd_gather_async(cmd, check=False)
+    if rc != 0:
+        logger.warning(f"Error accessing nightly release info for {cmd[4]}:  {err}")
+    return rc, out, err
+
+
+async def _fetch_release_info_json(
+    pullspec: str, registry_config: Optional[str], logger: logging.Logger, cache_dir: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Returns the parsed output of `oc adm release info -o=json` for a release pullspec, or None if it could
+    not be gathered. Nightly names embed a timestamp, so their pullspecs never change content; when a
+    cache_dir is given (doozer --cache-dir), results are reused across runs for _RELEASE_INFO_CACHE_TTL.
+    """
+    cache_file = _release_info_cache_file(cache_dir, pullspec) if cache_dir else None
+    if cache_file:
+        try:
+            if cache_file.stat().st_mtime >= (datetime.now() - _RELEASE_INFO_CACHE_TTL).timestamp():
+                return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass
+
+    cmd: List[str] = ["oc", "adm", "release", "info", pullspec, "-o=json"]
+    if registry_config:
+        cmd.append(f"--registry-config={registry_config}")
+    rc, release_json_str, _ = await _gather_release_info(cmd, logger)
+    if rc != 0:
+        return None
+
+    release_info = json.loads(release_json_str)
+    if cache_file:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _prune_release_info_cache(cache_file.parent, logger)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(release_json_str)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            logger.debug(f"Unable to cache release info for {pullspec}", exc_info=True)
+    return release_info
+
+
+@functools.lru_cache(maxsize=1024)
+def _inconsistency_annotation_value(msgs: Tuple[str, ...]) -> str:
+    """
+    Sorts, truncates and JSON encodes inconsistency messages. The assembly-wide issues are annotated onto
+    every arch/privacy imagestream, so identical message lists are encoded once.
+    """
+    sorted_msgs = sorted(msgs)
+    if len(sorted_msgs) > 5:
+        # an exhaustive list of the problems may be too large; that goes in the state file.
+        sorted_msgs[5:] = ["(...and more)"]
+    return json.dumps(sorted_msgs)
+
+
 class PayloadGenerator:
     def __init__(self, runtime: Runtime = None, package_rpm_finder=None):
         self.runtime = runtime
         self.package_rpm_finder = package_rpm_finder
+        # distgit_key => (payload tag name, explicitly declared, arches); see get_payload_image_info
+        self._payload_image_info: Optional[Dict[str, Tuple[str, bool, FrozenSet[str]]]] = None
 
     @staticmethod
     def find_mismatched_siblings(
@@ -2309,12 +2498,13 @@ class PayloadGenerator:
             # If an artist overrides one sibling's git url, but not another, the following
             # scan would not be able to detect that they were siblings. Instead, we rely on the
             # original image metadata to determine sibling-ness.
-            raw_source = build_record_inspector.get_image_meta().raw_config.content.source
+            image_meta = build_record_inspector.get_image_meta()
+            raw_source = image_meta.raw_config.content.source
 
             if raw_source.allow_mismatched_siblings:
                 logger.info(
                     "Skipping sibling check for %s (allow_mismatched_siblings is set)",
-                    build_record_inspector.get_image_meta().distgit_key,
+                    image_meta.distgit_key,
                 )
                 continue
 
@@ -2327,8 +2517,8 @@ class PayloadGenerator:
             # Make sure URLs are comparable regardless of git: or https:
             source_url = convert_remote_git_to_https(source_url)
 
-            potential_conflict: RepoBuildRecord = repo_builds.get(source_url, None)
-            if potential_conflict:
+            potential_conflict: Optional[RepoBuildRecord] = repo_builds.get(source_url)
+            if potential_conflict is not None:
                 # Another component has build from this repo before. Make
                 # sure it built from the same commit.
                 if potential_conflict.source_git_commit != source_git_commit:
@@ -2356,22 +2546,17 @@ class PayloadGenerator:
                  if there are no inconsistencies detected.
         """
 
-        rpm_uses: Dict[str, Set[str]] = {}
+        rpm_uses: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))  # name => nvr => arches
 
         for rhcos_build in rhcos_builds:
-            for name, epoch, version, release, arch, repo_name in rhcos_build.get_os_metadata_rpm_list():
+            brew_arch = rhcos_build.brew_arch
+            for name, _, version, release, _, repo_name in rhcos_build.get_os_metadata_rpm_list():
                 if repo_name in COREOS_RHEL10_STREAMS:
                     continue
-                rpm_name = name
-                nvr = f"{name}-{version}-{release}"
-                if rpm_name not in rpm_uses:
-                    rpm_uses[rpm_name] = dict()
-                if nvr not in rpm_uses[rpm_name]:
-                    rpm_uses[rpm_name][nvr] = []
-                rpm_uses[rpm_name][nvr].append(rhcos_build.brew_arch)
+                rpm_uses[name][f"{name}-{version}-{release}"].append(brew_arch)
 
         # Report back rpm name keys which were associated with more than one NVR in the set of RHCOS builds.
-        return {rpm_name: nvr_dict for rpm_name, nvr_dict in rpm_uses.items() if len(nvr_dict) > 1}
+        return {rpm_name: dict(nvr_dict) for rpm_name, nvr_dict in rpm_uses.items() if len(nvr_dict) > 1}
 
     @staticmethod
     def find_rhcos_build_kernel_inconsistencies(rhcos_build: RHCOSBuildInspector) -> List[Dict[str, str]]:
@@ -2506,8 +2691,9 @@ class PayloadGenerator:
             build_record = bri.get_build_obj()  # Returns KonfluxBuildRecord
             installed_packages = build_record.installed_packages  # List of package NVRs
 
-            # Filter for packages matching the name we're checking
-            matching_packages = [pkg_nvr for pkg_nvr in installed_packages if parse_nvr(pkg_nvr)['name'] == pkg]
+            # Filter for packages matching the name we're checking. Only the name is needed, which is everything
+            # before the last two '-' separators, so skip the full parse_nvr decomposition.
+            matching_packages = [pkg_nvr for pkg_nvr in installed_packages if pkg_nvr.rsplit('-', 2)[0] == pkg]
 
             if not matching_packages:
                 return AssemblyIssue(
@@ -2795,15 +2981,12 @@ class PayloadGenerator:
         # Some codes aren't critical to be marked as a blocking inconsistency for payloads
         exclude_assembly_issues = [AssemblyIssueCode.OUTDATED_RPMS_IN_STREAM_BUILD]
 
-        msgs = sorted([i.msg for i in inconsistencies if i.code not in exclude_assembly_issues])
+        msgs = tuple(i.msg for i in inconsistencies if i.code not in exclude_assembly_issues)
 
         if not msgs:
             return {}
 
-        if len(msgs) > 5:
-            # an exhaustive list of the problems may be too large; that goes in the state file.
-            msgs[5:] = ["(...and more)"]
-        return {"release.openshift.io/inconsistency": json.dumps(msgs)}
+        return {"release.openshift.io/inconsistency": _inconsistency_annotation_value(msgs)}
 
     def build_imagestream_annotations(self, inconsistencies: Iterable[AssemblyIssue]) -> Dict:
         annotations = {}
@@ -2811,6 +2994,22 @@ class PayloadGenerator:
         annotations.update(self.build_pipeline_metadata_annotations())
         return annotations
 
+    def get_payload_image_info(
+        self, assembly_inspector: AssemblyInspector
+    ) -> Dict[str, Tuple[str, bool, FrozenSet[str]]]:
+        """
+        The payload tag and arches of an image do not depend on the arch or privacy mode being generated,
+        so they are computed once and shared by every get_group_payload_tag_mapping call.
+        :return: Returns a map[distgit_key] -> (payload_tag_name, explicitly_declared, arches) for each payload image.
+        """
+        if self._payload_image_info is None:
+            self._payload_image_info = {
+                dgk: (*image_meta.get_payload_tag_info(), frozenset(image_meta.get_arches()))
+                for dgk, image_meta in assembly_inspector.runtime.image_map.items()
+                if image_meta.is_payload
+            }
+        return self._payload_image_info
+
     def get_group_payload_tag_mapping(
         self, assembly_inspector: AssemblyInspector, arch: str
     ) -> Dict[str, Optional[ImageInspector]]:
@@ -2826,6 +3025,7 @@ class PayloadGenerator:
         members: Dict[str, Optional[ImageInspector]] = (
             dict()
         )  # Maps release payload tag name to the archive which should populate it
+        payload_image_info = self.get_payload_image_info(assembly_inspector)
         for dgk, build_inspector in assembly_inspector.get_group_release_images().items():
             if build_inspector is None:
                 # There was no build for this image found associated with the assembly.
@@ -2836,16 +3036,15 @@ class PayloadGenerator:
                 )
                 continue
 
-            image_meta: ImageMetadata = assembly_inspector.runtime.image_map[dgk]
-
-            if not image_meta.is_payload:
+            if dgk not in payload_image_info:
                 # Nothing to do for images which are not in the payload
                 continue
 
-            # The tag that will be used in the imagestreams and whether it was explicitly declared.
-            tag_name, explicit = image_meta.get_payload_tag_info()
+            # The tag that will be used in the imagestreams, whether it was explicitly declared,
+            # and the arches the image is built for.
+            tag_name, explicit, image_arches = payload_image_info[dgk]
 
-            if arch not in image_meta.get_arches():
+            if arch not in image_arches:
                 # If this image is not meant for this architecture
                 if tag_name not in members:
                     members[tag_name] = None  # We still need a placeholder in the tag mapping
@@ -2869,7 +3068,7 @@ class PayloadGenerator:
                 # conflicts with the `arch not in image_meta.get_arches()` check above.
                 # Best to fail.
                 raise IOError(
-                    f"{dgk} claims to be built for {image_meta.get_arches()} "
+                    f"{dgk} claims to be built for {sorted(image_arches)} "
                     f"but did not find {brew_arch} build for {build_inspector.get_build_webpage_url()}"
                 )
 
@@ -2888,86 +3087,104 @@ class PayloadGenerator:
         issues: List[str]
         runtime.logger.info(f"Processing nightly: {nightly}")
 
-        major_minor, _, _ = isolate_nightly_name_components(nightly)
-        if major_minor != runtime.get_minor_version():
-            return terminal_issue(f"Specified nightly {nightly} does not match group major.minor")
-
         try:
             pullspec = get_nightly_pullspec(nightly, runtime.build_system)
         except ValueError as e:
             return terminal_issue(str(e))
 
-        retries: int = 3
-        release_json_str = ""
-        rc = -1
-        while retries > 0:
-            cmd: List[str] = ["oc", "adm", "release", "info", pullspec, "-o=json"]
-            if runtime.registry_config:
-                cmd.append(f"--registry-config={runtime.registry_config}")
-            rc, release_json_str, err = await exectools.cmd_gather_async(cmd, check=False)
-            if rc == 0:
-                break
-            runtime.logger.warn(f"Error accessing nightly release info for {pullspec}:  {err}")
-            retries -= 1
-
-        if rc != 0:
-            return terminal_issue(f"Unable to gather nightly release info details: {pullspec}; garbage collected?")
-
-        release_info = Model(dict_to_model=json.loads(release_json_str))
-        if not release_info.references.spec.tags:
-            return terminal_issue(f"Could not find tags in nightly {nightly}")
-
+        # The release info comes from the registry while the payload entries come from the assembly's builds;
+        # neither depends on the other, so look them up concurrently.
         payload_entries: Dict[str, PayloadEntry]
         issues: List[AssemblyIssue]
         registry_config = runtime.registry_config
-        payload_entries, issues = self.find_payload_entries(
-            assembly_inspector, arch, "", registry_config=registry_config
+        release_info, (payload_entries, issues) = await asyncio.gather(
+            _fetch_release_info_json(pullspec, registry_config, runtime.logger, runtime.cache_dir),
+            exectools.to_thread(
+                self.find_payload_entries, assembly_inspector, arch, "", registry_config=registry_config
+            ),
         )
-        rhcos_container_configs = {tag.name: tag for tag in rhcos.get_container_configs(runtime)}
-        for component_tag in release_info.references.spec.tags:  # For each tag in the imagestream
-            payload_tag_name: str = component_tag.name  # e.g. "aws-ebs-csi-driver"
-            payload_tag_pullspec: str = component_tag["from"].name  # quay pullspec
-            if "@" not in payload_tag_pullspec:
-                # This speaks to an invalid nightly, so raise and exception
-                raise IOError(
-                    f"Expected pullspec in {nightly}:{payload_tag_name} to be sha digest "
-                    f"but found invalid: {payload_tag_pullspec}"
-                )
+        if release_info is None:
+            return terminal_issue(f"Unable to gather nightly release info details: {pullspec}; garbage collected?")
 
-            pullspec_sha = payload_tag_pullspec.rsplit("@", 1)[-1]
-            entry = payload_entries.get(payload_tag_name, None)
+        tags = release_info.get("references", {}).get("spec", {}).get("tags")
+        if not tags:
+            return terminal_issue(f"Could not find tags in nightly {nightly}")
 
-            if not entry:
-                raise IOError(f"Did not find {nightly} payload tag {payload_tag_name} in computed assembly payload")
+        rhcos_container_configs = {tag.name: tag for tag in rhcos.get_container_configs(runtime)}
+        expected_digests = self._expected_nightly_digests(payload_entries, rhcos_container_configs)
+        nightly_digests = {(tag["name"], tag["from"]["name"].rpartition("@")[2]) for tag in tags}
+        if nightly_digests <= expected_digests.items():
+            # The common case: every tag agrees with the assembly, so there is nothing to describe.
+            return issues
+
+        for component_tag in tags:  # For each tag in the imagestream
+            issue = self._check_nightly_tag_consistency(nightly, component_tag, payload_entries, expected_digests)
+            if issue:
+                issues.append(issue)
 
-            if entry.image_inspector:
-                if entry.image_inspector.get_digest() != pullspec_sha:
-                    # Impermissible because the artist should remove
-                    # the reference nightlies from the assembly definition
-                    issues.append(
-                        AssemblyIssue(
-                            f"{nightly} contains {payload_tag_name} sha {pullspec_sha} but assembly computed archive: "
-                            f"{entry.image_inspector.get_pullspec()}",
-                            component="reference-releases",
-                        )
-                    )
+        return issues
 
+    @staticmethod
+    def _expected_nightly_digests(
+        payload_entries: Dict[str, PayloadEntry], rhcos_container_configs: Dict[str, Model]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Compute, once per arch, the digest the assembly expects reference nightlies to carry for each payload tag.
+        :return: Map[payload_tag_name] -> digest; None for entries that can't be compared.
+        """
+        expected: Dict[str, Optional[str]] = {}
+        for payload_tag_name, entry in payload_entries.items():
+            if entry.image_inspector:
+                expected[payload_tag_name] = entry.image_inspector.get_digest()
             elif entry.rhcos_build:
-                actual_digest = entry.rhcos_build.get_container_digest(rhcos_container_configs[payload_tag_name])
-                if actual_digest != pullspec_sha:
-                    # Impermissible because the artist should remove the reference nightlies
-                    # from the assembly definition
-                    issues.append(
-                        AssemblyIssue(
-                            f'{nightly} contains {payload_tag_name} sha {pullspec_sha} but assembly computed rhcos:'
-                            f' {entry.rhcos_build} and {actual_digest}',
-                            component='reference-releases',
-                        )
-                    )
+                expected[payload_tag_name] = entry.rhcos_build.get_container_digest(
+                    rhcos_container_configs[payload_tag_name]
+                )
             else:
-                raise IOError(f"Unsupported payload entry {entry}")
+                expected[payload_tag_name] = None
+        return expected
 
-        return issues
+    @staticmethod
+    def _check_nightly_tag_consistency(
+        nightly: str,
+        component_tag: Dict[str, Any],
+        payload_entries: Dict[str, PayloadEntry],
+        expected_digests: Dict[str, Optional[str]],
+    ) -> Optional[AssemblyIssue]:
+        """
+        Compare one tag of a reference nightly's imagestream against the computed assembly payload.
+        :return: Returns an AssemblyIssue if the nightly and the assembly disagree on the tag's digest, else None.
+        """
+        payload_tag_name: str = component_tag["name"]  # e.g. "aws-ebs-csi-driver"
+        payload_tag_pullspec: str = component_tag["from"]["name"]  # quay pullspec
+        _, sep, pullspec_sha = payload_tag_pullspec.rpartition("@")
+        if not sep:
+            # This speaks to an invalid nightly, so raise and exception
+            raise IOError(
+                f"Expected pullspec in {nightly}:{payload_tag_name} to be sha digest "
+                f"but found invalid: {payload_tag_pullspec}"
+            )
+
+        if payload_tag_name not in expected_digests:
+            raise IOError(f"Did not find {nightly} payload tag {payload_tag_name} in computed assembly payload")
+
+        actual_digest = expected_digests[payload_tag_name]
+        if actual_digest == pullspec_sha:
+            return None
+
+        # Impermissible because the artist should remove
+        # the reference nightlies from the assembly definition
+        entry = payload_entries[payload_tag_name]
+        if entry.image_inspector:
+            computed = f"archive: {entry.image_inspector.get_pullspec()}"
+        elif entry.rhcos_build:
+            computed = f"rhcos: {entry.rhcos_build} and {actual_digest}"
+        else:
+            raise IOError(f"Unsupported payload entry {entry}")
+        return AssemblyIssue(
+            f"{nightly} contains {payload_tag_name} sha {pullspec_sha} but assembly computed {computed}",
+            component="reference-releases",
+        )
 
     @staticmethod
     @start_as_current_span_async(TRACER, "GenPayloadCli.check_nightlies_consistency")
@@ -2981,10 +3198,23 @@ class PayloadGenerator:
         if not basis or not basis.reference_releases:
             return []
 
-        issues: List[AssemblyIssue] = []
+        reference_releases: Dict[str, str] = basis.reference_releases.primitive()
+        group_minor_version = assembly_inspector.runtime.get_minor_version()
+        issues: List[AssemblyIssue] = [
+            AssemblyIssue(
+                f"Specified nightly {nightly} does not match group major.minor", component="reference-releases"
+            )
+            for nightly in reference_releases.values()
+            if isolate_nightly_name_components(nightly)[0] != group_minor_version
+        ]
+        if issues:
+            # A reference nightly from another release can never match; report it without waiting on
+            # registry lookups for the remaining nightlies.
+            return issues
+
         tasks = []
         generator = PayloadGenerator()
-        for arch, nightly in basis.reference_releases.primitive().items():
+        for arch, nightly in reference_releases.items():
             tasks.append(generator._check_nightly_consistency(assembly_inspector, nightly, arch))
         results = await asyncio.gather(*tasks)
         issues.extend([issue for result in results for issue in result])
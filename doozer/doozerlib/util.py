@@ -274,6 +274,7 @@ def isolate_git_commit_in_release(release: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=128)
 def isolate_nightly_name_components(nightly_name: str) -> (str, str, bool):
     """
     Given a release name (e.g. 4.8.0-0.nightly-s390x-2021-07-02-143555, 4.1.0-0.nightly-priv-2019-11-08-213727),
@@ -1,5 +1,10 @@
+import asyncio
 import io
+import json
 import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -15,6 +20,7 @@ from doozerlib.cli import release_gen_payload as rgp_cli
 from doozerlib.exceptions import DoozerFatalError
 from doozerlib.image import ImageMetadata
 from flexmock import flexmock
+from tenacity import wait_none
 
 
 async def no_sleep(arg):
@@ -69,6 +75,25 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
         self.assertEqual([], issues)
         self.assertEqual(2, len(rhcos_entries))
 
+    def test_get_group_payload_tag_mapping(self):
+        alpha_meta = MagicMock(is_payload=True)
+        alpha_meta.get_payload_tag_info.return_value = ("alpha", False)
+        alpha_meta.get_arches.return_value = ["x86_64"]
+        beta_meta = MagicMock(is_payload=False)
+        alpha_bri = MagicMock()
+        alpha_bri.get_image_inspector.return_value = "alpha-x86_64"
+        assembly_inspector = MagicMock()
+        assembly_inspector.runtime.image_map = dict(alpha=alpha_meta, beta=beta_meta)
+        assembly_inspector.get_group_release_images.return_value = dict(alpha=alpha_bri, beta=MagicMock())
+
+        pg = rgp_cli.PayloadGenerator()
+        self.assertEqual(pg.get_group_payload_tag_mapping(assembly_inspector, "x86_64"), dict(alpha="alpha-x86_64"))
+        self.assertEqual(pg.get_group_payload_tag_mapping(assembly_inspector, "aarch64"), dict(alpha=None))
+        # payload tag info is computed once and reused for every arch
+        alpha_meta.get_payload_tag_info.assert_called_once()
+        alpha_meta.get_arches.assert_called_once()
+        beta_meta.get_payload_tag_info.assert_not_called()
+
     # test parameter validation
     def test_parameter_validation(self):
         # test when assembly is not valid
@@ -297,12 +322,38 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
         pg_eissuesfp_mock.return_value = ["embargo_issues"]
 
         test_payload_entry = rgp_cli.PayloadEntry(image_meta=Mock(distgit_key="spam"), issues=[], dest_pullspec="dummy")
-        pg_findpe_mock.return_value = (dict(tag1=test_payload_entry), ["issues"])
+        issue = AssemblyIssue("issues", "spam")
+        pg_findpe_mock.return_value = (dict(tag1=test_payload_entry), [issue])
         e4a = await gpcli.generate_payload_entries(Mock(AssemblyInspector))
         self.assertEqual(
             e4a, (dict(ppc64le=dict(tag1=test_payload_entry)), dict(ppc64le=dict(tag1=test_payload_entry)))
         )
-        self.assertEqual(gpcli.assembly_issues, ["issues", "embargo_issues"])
+        self.assertEqual(gpcli.assembly_issues, [issue, "embargo_issues"])
+
+    @patch("doozerlib.cli.release_gen_payload.PayloadGenerator.find_payload_entries")
+    @patch("doozerlib.cli.release_gen_payload.PayloadGenerator.embargo_issues_for_payload")
+    async def test_generate_payload_entries_private_only_issues(self, pg_eissuesfp_mock, pg_findpe_mock):
+        """
+        Issues found by both the public and private passes are only recorded once
+        """
+        gpcli = rgp_cli.GenPayloadCli(
+            exclude_arch=[],
+            runtime=MagicMock(arches=["ppc64le"]),
+        )
+        pg_eissuesfp_mock.return_value = []
+
+        test_payload_entry = rgp_cli.PayloadEntry(image_meta=Mock(distgit_key="spam"), issues=[], dest_pullspec="dummy")
+        shared_issue = AssemblyIssue("shared", "spam", AssemblyIssueCode.IMPERMISSIBLE)
+        private_issue = AssemblyIssue("private", "spam", AssemblyIssueCode.IMPERMISSIBLE)
+        pg_findpe_mock.side_effect = [
+            (dict(tag1=test_payload_entry), [shared_issue]),
+            (
+                dict(tag1=test_payload_entry),
+                [AssemblyIssue("shared", "spam", AssemblyIssueCode.IMPERMISSIBLE), private_issue],
+            ),
+        ]
+        await gpcli.generate_payload_entries(Mock(AssemblyInspector))
+        self.assertEqual(gpcli.assembly_issues, [shared_issue, private_issue])
 
     @patch("doozerlib.cli.release_gen_payload.PayloadGenerator.find_payload_entries")
     async def test_generate_payload_entries_rhcos(self, pg_findpe_mock):
@@ -393,6 +444,23 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
         gpcli.detect_rhcos_inconsistent_rpms({False: ["rbi"], True: []})
         self.assertEqual(gpcli.assembly_issues[0].code, AssemblyIssueCode.INCONSISTENT_RHCOS_RPMS)
 
+    def test_find_rhcos_build_rpm_inconsistencies(self):
+        x86 = Mock(rhcos.RHCOSBuildInspector, brew_arch="x86_64")
+        x86.get_os_metadata_rpm_list.return_value = [
+            ["bash", "0", "5.1", "1.el9", "x86_64", "rhel-coreos"],
+            ["kernel", "0", "5.14", "1.el9", "x86_64", "rhel-coreos"],
+            ["kernel", "0", "6.12", "1.el10", "x86_64", "rhel-coreos-10"],
+        ]
+        arm = Mock(rhcos.RHCOSBuildInspector, brew_arch="aarch64")
+        arm.get_os_metadata_rpm_list.return_value = [
+            ["bash", "0", "5.1", "1.el9", "aarch64", "rhel-coreos"],
+            ["kernel", "0", "5.14", "2.el9", "aarch64", "rhel-coreos"],
+        ]
+        self.assertEqual(
+            rgp_cli.PayloadGenerator.find_rhcos_build_rpm_inconsistencies([x86, arm]),
+            {"kernel": {"kernel-5.14-1.el9": ["x86_64"], "kernel-5.14-2.el9": ["aarch64"]}},
+        )
+
     def test_summarize_issue_permits(self):
         gpcli = rgp_cli.GenPayloadCli(runtime=MagicMock(assembly_type=AssemblyTypes.STREAM))
         gpcli.assembly_issues = [
@@ -404,6 +472,7 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
         self.assertFalse(permitted)
         self.assertTrue(report["spam"][0]["permitted"])
         self.assertFalse(report["eggs"][0]["permitted"])
+        self.assertIs(type(report), dict)  # must stay representable by yaml SafeDumper
 
     def test_summarize_issue_permits_embargo(self):
         """
@@ -719,22 +788,24 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
         open_mock.return_value.__aenter__.return_value.write = AsyncMock(side_effect=lambda s: buffer.write(s))
 
         await gpcli.write_imagestream_artifact_file("ocp-s390x", "release-s390x", ["rhcos", "eggs"], True)
+        open_mock.assert_called_once_with(
+            Path("/tmp/updated-tags-for.ocp-s390x.release-s390x-partial.json"), mode="w+", encoding="utf-8"
+        )
         self.assertEqual(
-            buffer.getvalue().strip(),
-            f"""
-apiVersion: image.openshift.io/v1
-kind: ImageStream
-metadata:
-  annotations:
-    release.openshift.io/build-url: {os.getenv('BUILD_URL', "''")}
-    release.openshift.io/runtime-brew-event: '999999'
-  name: release-s390x
-  namespace: ocp-s390x
-spec:
-  tags:
-  - rhcos
-  - eggs
-        """.strip(),
+            json.loads(buffer.getvalue()),
+            {
+                "apiVersion": "image.openshift.io/v1",
+                "kind": "ImageStream",
+                "metadata": {
+                    "annotations": {
+                        "release.openshift.io/build-url": os.getenv('BUILD_URL', ''),
+                        "release.openshift.io/runtime-brew-event": "999999",
+                    },
+                    "name": "release-s390x",
+                    "namespace": "ocp-s390x",
+                },
+                "spec": {"tags": ["rhcos", "eggs"]},
+            },
         )
 
     @patch("doozerlib.cli.release_gen_payload.oc")
@@ -808,6 +879,189 @@ spec:
             "issue1,issue2", istream_apiobj.model.metadata.annotations["release.openshift.io/inconsistency"]
         )
 
+    def test_build_inconsistency_annotations(self):
+        self.assertEqual(rgp_cli.PayloadGenerator.build_inconsistency_annotations([]), {})
+        outdated = AssemblyIssue("outdated", "spam", AssemblyIssueCode.OUTDATED_RPMS_IN_STREAM_BUILD)
+        self.assertEqual(rgp_cli.PayloadGenerator.build_inconsistency_annotations([outdated]), {})
+
+        issues = [AssemblyIssue(f"issue {i}", "spam") for i in reversed(range(7))] + [outdated]
+        expected = {
+            "release.openshift.io/inconsistency": json.dumps(
+                ["issue 0", "issue 1", "issue 2", "issue 3", "issue 4", "(...and more)"]
+            )
+        }
+        self.assertEqual(rgp_cli.PayloadGenerator.build_inconsistency_annotations(issues), expected)
+        # identical inputs are served from the cache but still get their own dict
+        again = rgp_cli.PayloadGenerator.build_inconsistency_annotations(issues)
+        self.assertEqual(again, expected)
+        again["extra"] = "value"
+        self.assertNotIn("extra", rgp_cli.PayloadGenerator.build_inconsistency_annotations(issues))
+
+    def test_check_nightly_tag_consistency(self):
+        image_inspector = Mock(get_digest=Mock(return_value="sha256:abc"), get_pullspec=Mock(return_value="reg/img@x"))
+        rhcos_build = Mock(get_container_digest=Mock(return_value="sha256:os"))
+        payload_entries = dict(
+            spam=rgp_cli.PayloadEntry(issues=[], dest_pullspec="dummy", image_inspector=image_inspector),
+            rhel_coreos=rgp_cli.PayloadEntry(issues=[], dest_pullspec="dummy", rhcos_build=rhcos_build),
+        )
+        rhcos_configs = dict(rhel_coreos=Model(dict(name="rhel_coreos")))
+        expected = rgp_cli.PayloadGenerator._expected_nightly_digests(payload_entries, rhcos_configs)
+        self.assertEqual(expected, dict(spam="sha256:abc", rhel_coreos="sha256:os"))
+        rhcos_build.get_container_digest.assert_called_once_with(rhcos_configs["rhel_coreos"])
+
+        def tag(name, pullspec):
+            return {"name": name, "from": {"name": pullspec}}
+
+        check = rgp_cli.PayloadGenerator._check_nightly_tag_consistency
+        nightly = "4.19.0-0.nightly-2025-01-01-000000"
+        self.assertIsNone(check(nightly, tag("spam", "quay.io/r@sha256:abc"), payload_entries, expected))
+        self.assertIsNone(check(nightly, tag("rhel_coreos", "quay.io/r@sha256:os"), payload_entries, expected))
+
+        issue = check(nightly, tag("spam", "quay.io/r@sha256:def"), payload_entries, expected)
+        self.assertEqual(issue.component, "reference-releases")
+        self.assertIn("spam sha sha256:def", issue.msg)
+        issue = check(nightly, tag("rhel_coreos", "quay.io/r@sha256:other"), payload_entries, expected)
+        self.assertIn("assembly computed rhcos", issue.msg)
+
+        with self.assertRaises(IOError):
+            check(nightly, tag("spam", "quay.io/r:latest"), payload_entries, expected)
+        with self.assertRaises(IOError):
+            check(nightly, tag("eggs", "quay.io/r@sha256:abc"), payload_entries, expected)
+
+    @patch("doozerlib.cli.release_gen_payload.rhcos.get_container_configs", return_value=[])
+    @patch("doozerlib.cli.release_gen_payload.get_nightly_pullspec", return_value="reg/release:nightly")
+    @patch("doozerlib.cli.release_gen_payload._fetch_release_info_json")
+    async def test_check_nightly_consistency(self, fetch_mock, *_):
+        image_inspector = Mock(get_digest=Mock(return_value="sha256:abc"), get_pullspec=Mock(return_value="reg/img@x"))
+        payload_entries = dict(
+            spam=rgp_cli.PayloadEntry(issues=[], dest_pullspec="dummy", image_inspector=image_inspector),
+            eggs=rgp_cli.PayloadEntry(issues=[], dest_pullspec="dummy", image_inspector=image_inspector),
+        )
+        payload_issue = AssemblyIssue("payload", component="spam")
+        runtime = MagicMock(get_minor_version=Mock(return_value="4.19"))
+        gen = rgp_cli.PayloadGenerator()
+        flexmock(gen).should_receive("find_payload_entries").replace_with(
+            lambda *_, **__: (payload_entries, [payload_issue])
+        )
+        nightly = "4.19.0-0.nightly-2025-01-01-000000"
+
+        def release_info(digest):
+            tags = [{"name": "spam", "from": {"name": f"quay.io/r@{digest}"}}]
+            return {"references": {"spec": {"tags": tags}}}
+
+        fetch_mock.return_value = release_info("sha256:abc")
+        with patch.object(gen, "_check_nightly_tag_consistency") as tag_check_mock:
+            issues = await gen._check_nightly_consistency(MagicMock(runtime=runtime), nightly, "x86_64")
+        self.assertEqual(issues, [payload_issue])
+        tag_check_mock.assert_not_called()
+
+        fetch_mock.return_value = release_info("sha256:def")
+        issues = await gen._check_nightly_consistency(MagicMock(runtime=runtime), nightly, "x86_64")
+        self.assertEqual(len(issues), 2)
+        self.assertIn("spam sha sha256:def", issues[1].msg)
+
+        fetch_mock.return_value = None
+        issues = await gen._check_nightly_consistency(MagicMock(runtime=runtime), nightly, "x86_64")
+        self.assertIn("Unable to gather nightly release info", issues[0].msg)
+
+    async def test_finish_nightlies_consistency_task(self):
+        gpcli = rgp_cli.GenPayloadCli(MagicMock())
+        await gpcli._finish_nightlies_consistency_task()  # no task started
+
+        # an abandoned comparison is cancelled rather than left running.
+        # asyncio.sleep is stubbed out in this module, so block on an event instead.
+        started = asyncio.Event()
+
+        async def block():
+            started.set()
+            await asyncio.Event().wait()
+
+        gpcli.nightlies_consistency_task = asyncio.create_task(block())
+        await started.wait()
+        await gpcli._finish_nightlies_consistency_task()
+        self.assertTrue(gpcli.nightlies_consistency_task.cancelled())
+
+        # a failed comparison has its exception retrieved
+        async def fail():
+            raise IOError("registry unavailable")
+
+        gpcli.nightlies_consistency_task = asyncio.create_task(fail())
+        await asyncio.wait({gpcli.nightlies_consistency_task})
+        await gpcli._finish_nightlies_consistency_task()
+        self.assertIsInstance(gpcli.nightlies_consistency_task.exception(), IOError)
+
+    @patch("doozerlib.cli.release_gen_payload.PayloadGenerator._check_nightly_consistency")
+    @patch("doozerlib.cli.release_gen_payload.assembly_basis")
+    async def test_check_nightlies_consistency(self, basis_mock, cnc_mock):
+        runtime = MagicMock(get_minor_version=Mock(return_value="4.19"))
+        assembly_inspector = MagicMock(runtime=runtime)
+        basis_mock.return_value = Model(
+            dict(
+                reference_releases=dict(
+                    x86_64="4.19.0-0.nightly-2025-01-01-000000",
+                    aarch64="4.19.0-0.nightly-arm64-2025-01-01-000000",
+                )
+            )
+        )
+        cnc_mock.side_effect = [[AssemblyIssue("x86", component="reference-releases")], []]
+        issues = await rgp_cli.PayloadGenerator.check_nightlies_consistency(assembly_inspector)
+        self.assertEqual([i.msg for i in issues], ["x86"])
+        self.assertEqual(cnc_mock.call_count, 2)
+
+        # a nightly from another release short-circuits the registry lookups
+        cnc_mock.reset_mock()
+        basis_mock.return_value.reference_releases.aarch64 = "4.18.0-0.nightly-arm64-2025-01-01-000000"
+        issues = await rgp_cli.PayloadGenerator.check_nightlies_consistency(assembly_inspector)
+        self.assertEqual(len(issues), 1)
+        self.assertIn("does not match group major.minor", issues[0].msg)
+        cnc_mock.assert_not_called()
+
+    @patch("doozerlib.cli.release_gen_payload.exectools.cmd_gather_async")
+    async def test_fetch_release_info_json(self, gather_mock):
+        release_info = {"references": {"spec": {"tags": []}}}
+        gather_mock.side_effect = [(1, "", "boom"), (0, json.dumps(release_info), "")]
+        pullspec = "registry.ci.openshift.org/ocp/release:4.19.0-0.nightly-2025-01-01-000000"
+        release_json = (0, json.dumps(release_info), "")
+        with (
+            TemporaryDirectory() as tmpdir,
+            patch.object(rgp_cli._gather_release_info.retry, "wait", wait_none()),
+        ):
+            logger = MagicMock()
+            fetch = rgp_cli._fetch_release_info_json
+
+            # nothing is cached unless a cache dir is given
+            self.assertEqual(await fetch(pullspec, None, logger), release_info)
+            gather_mock.side_effect = [release_json]
+            self.assertEqual(await fetch(pullspec, None, logger), release_info)
+            self.assertEqual(gather_mock.call_count, 3)
+            self.assertEqual(os.listdir(tmpdir), [])
+
+            # served from the on-disk cache the second time around
+            gather_mock.side_effect = [release_json]
+            self.assertEqual(await fetch(pullspec, None, logger, cache_dir=tmpdir), release_info)
+            self.assertEqual(await fetch(pullspec, None, logger, cache_dir=tmpdir), release_info)
+            self.assertEqual(gather_mock.call_count, 4)
+
+            # stale entries are neither used nor kept
+            cache_path = Path(tmpdir, "release-info")
+            (cached,) = cache_path.iterdir()
+            stale = Path(cache_path, "stale.json")
+            stale.write_text("{}")
+            old = (datetime.now() - timedelta(days=2)).timestamp()
+            os.utime(cached, (old, old))
+            os.utime(stale, (old, old))
+            gather_mock.side_effect = [release_json]
+            self.assertEqual(await fetch(pullspec, None, logger, cache_dir=tmpdir), release_info)
+            self.assertEqual(gather_mock.call_count, 5)
+            self.assertEqual(list(cache_path.iterdir()), [cached])
+
+            gather_mock.side_effect = [(1, "", "boom")] * 3
+            self.assertIsNone(await fetch(pullspec + "-gone", "reg.json", logger, cache_dir=tmpdir))
+            gather_mock.assert_called_with(
+                ["oc", "adm", "release", "info", pullspec + "-gone", "-o=json", "--registry-config=reg.json"],
+                check=False,
+            )
+
     def test_get_multi_release_names(self):
         runtime = MagicMock(
             assembly="stream",
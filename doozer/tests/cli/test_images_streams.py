@@ -1,6 +1,12 @@
+import json
+import os
+import threading
+from types import SimpleNamespace
+
 import pytest
 from artcommonlib.model import Missing, Model
 from doozerlib.cli import images_streams
+from github import GithubException, UnknownObjectException
 
 # Fixtures
 
@@ -138,6 +144,22 @@ def test_resolve_upstream_from_with_member_using_payload_name(mocker, mock_runti
     assert result == 'registry.ci.openshift.org/ocp/4.18:custom-payload-name'
 
 
+def test_resolve_upstream_from_with_explicit_version(mocker, mock_runtime):
+    """Test that an explicitly passed MAJOR/MINOR is used instead of the group config"""
+    target_meta = mocker.MagicMock()
+    target_meta.config.content.source.ci_alignment.upstream_image = Missing
+    target_meta.config.payload_name = None
+    target_meta.config.name = 'openshift/ose-cli'
+
+    mock_runtime.resolve_image.return_value = target_meta
+
+    image_entry = Model({'member': 'cli'})
+
+    result = images_streams.resolve_upstream_from(mock_runtime, image_entry, '4', '19')
+
+    assert result == 'registry.ci.openshift.org/ocp/4.19:cli'
+
+
 def test_resolve_upstream_from_with_image_entry(mock_runtime):
     """Test resolving upstream from an image entry returns None"""
     image_entry = Model({'image': 'quay.io/centos/centos:stream8'})
@@ -342,6 +364,249 @@ def test_get_upstreaming_entries_image_build_not_found_skips(mocker, mock_runtim
     assert result == {}
 
 
+# Tests for mirror destination helpers
+
+
+def test_get_mirror_destinations():
+    """Test that the main destination comes first, followed by arm64 and upstream_image_mirror destinations"""
+    config = Model(
+        {
+            'upstream_image': 'registry.ci.openshift.org/ocp/4.17:base',
+            'upstream_image_base': 'registry.ci.openshift.org/ocp/4.17:base-intermediate',
+            'upstream_image_mirror': ['quay.io/openshift/ci:base'],
+        }
+    )
+
+    result = images_streams._get_mirror_destinations(config, mirror_arm=True)
+
+    assert result == [
+        'registry.ci.openshift.org/ocp/4.17:base-intermediate',
+        'registry.ci.openshift.org/ocp/4.17:base-intermediate-arm64',
+        'quay.io/openshift/ci:base',
+    ]
+
+
+def test_probe_mirror_destinations(mocker, mock_runtime):
+    """Test that destinations are probed and mapped to whether they exist"""
+    mock_runtime.arches = ['x86_64']
+    upstreaming_entries = {
+        'golang': Model({'mirror': True, 'upstream_image': 'registry.ci.openshift.org/ocp/4.17:golang'}),
+        'skipped': Model({'mirror': False, 'upstream_image': 'registry.ci.openshift.org/ocp/4.17:skipped'}),
+    }
+    mock_for_arch = mocker.patch.object(images_streams, 'oc_image_info_for_arch', return_value=None)
+
+    result = images_streams._probe_mirror_destinations(
+        mock_runtime, upstreaming_entries, force=False, registry_config_file=None
+    )
+
+    assert result == {'registry.ci.openshift.org/ocp/4.17:golang': False}
+    mock_for_arch.assert_called_once_with(
+        'registry.ci.openshift.org/ocp/4.17:golang', go_arch='amd64', registry_config=None, strict=False
+    )
+
+
+# Tests for _get_imagestream_tags
+
+
+def test_get_imagestream_tags(mocker, mock_runtime):
+    """Test that imagestream tags are fetched with one oc call per namespace"""
+    istag_list = {
+        'kind': 'List',
+        'items': [{'metadata': {'name': '4.17:base'}}, {'metadata': {'name': '4.17:golang'}}],
+    }
+    mock_gather = mocker.patch.object(
+        images_streams.exectools,
+        'cmd_gather',
+        side_effect=[(0, json.dumps(istag_list), ''), (0, '', '')],
+    )
+
+    result = images_streams._get_imagestream_tags(
+        mock_runtime, {'ocp': {'4.17:golang', '4.17:base', '4.17:missing'}, 'ci': {'missing:latest'}}
+    )
+
+    assert result == {
+        ('ocp', '4.17:base'): {'metadata': {'name': '4.17:base'}},
+        ('ocp', '4.17:golang'): {'metadata': {'name': '4.17:golang'}},
+    }
+    assert mock_gather.call_count == 2
+    mock_gather.assert_any_call('oc get -n ocp istag 4.17:base 4.17:golang 4.17:missing --ignore-not-found -o json')
+
+
+# Tests for _get_upstream_source
+
+
+def test_get_upstream_source_falls_back_when_branch_missing(mocker, mock_runtime):
+    """Test that the fallback branch is used when the target branch does not exist in the remote"""
+    images_streams._get_remote_branches.cache_clear()
+    mock_gather = mocker.patch.object(
+        images_streams.exectools,
+        'cmd_gather',
+        return_value=(0, 'abc123\trefs/heads/main\ndef456\trefs/heads/release-4.16\n', ''),
+    )
+    image_meta = Model(
+        {
+            'distgit_key': 'ose-test',
+            'config': {
+                'content': {
+                    'source': {
+                        'git': {
+                            'url': 'git@github.com:openshift-priv/test.git',
+                            'branch': {'target': 'release-4.17', 'fallback': 'main'},
+                        }
+                    }
+                }
+            },
+        }
+    )
+
+    assert images_streams._get_upstream_source(mock_runtime, image_meta) == (
+        'git@github.com:openshift-priv/test.git',
+        'main',
+    )
+    # The remote branches are cached
+    assert images_streams._get_remote_branches('git@github.com:openshift-priv/test.git') == {'main', 'release-4.16'}
+    mock_gather.assert_called_once_with('git ls-remote --exit-code --heads git@github.com:openshift-priv/test.git')
+
+
+def test_get_remote_branches_retries_transient_errors(mocker):
+    """Test that only transient ls-remote failures are retried"""
+    images_streams._get_remote_branches.cache_clear()
+    mock_gather = mocker.patch.object(
+        images_streams.exectools,
+        'cmd_gather',
+        side_effect=[(128, '', 'connection reset'), (2, '', '')],
+    )
+
+    # rc 2 means the remote has no branches; it is not retried
+    assert images_streams._get_remote_branches('https://github.com/openshift/empty') == frozenset()
+    assert mock_gather.call_count == 2
+
+    mock_gather.reset_mock(side_effect=True)
+    mock_gather.return_value = (128, '', 'connection reset')
+    with pytest.raises(ChildProcessError):
+        images_streams._get_remote_branches('https://github.com/openshift/unreachable')
+    assert mock_gather.call_count == 3
+
+
+# Tests for compute_dockerfile_digest
+
+
+def test_compute_dockerfile_digest_ignores_line_endings(tmp_path):
+    """Test that the digest does not depend on the line endings used in the Dockerfile"""
+    unix_df = tmp_path.joinpath('Dockerfile.unix')
+    unix_df.write_bytes(b'FROM base\nRUN true\n')
+    windows_df = tmp_path.joinpath('Dockerfile.windows')
+    windows_df.write_bytes(b'FROM base\r\nRUN true\r\n')
+    other_df = tmp_path.joinpath('Dockerfile.other')
+    other_df.write_bytes(b'FROM other\nRUN true\n')
+
+    digest = images_streams.compute_dockerfile_digest(unix_df)
+    assert digest == images_streams.compute_dockerfile_digest(windows_df)
+    assert digest != images_streams.compute_dockerfile_digest(other_df)
+
+
+def test_compute_dockerfile_content_digest_matches_file_digest(tmp_path):
+    """Test that hashing in-memory content gives the same digest as hashing the written file"""
+    dockerfile = tmp_path.joinpath('Dockerfile')
+    dockerfile.write_bytes(b'FROM base\r\nRUN true\r\n')
+
+    assert images_streams.compute_dockerfile_content_digest(
+        b'FROM base\nRUN true\n'
+    ) == images_streams.compute_dockerfile_digest(dockerfile)
+
+
+# Tests for is_pr_already_exists_error
+
+
+def test_is_pr_already_exists_error():
+    """Test that an existing PR is detected from structured and unstructured GitHub error payloads"""
+    already_exists = GithubException(
+        422,
+        {
+            'message': 'Validation Failed',
+            'errors': [
+                {
+                    'resource': 'PullRequest',
+                    'code': 'custom',
+                    'message': 'A pull request already exists for openshift-bot:art-consistency.',
+                }
+            ],
+        },
+    )
+    assert images_streams.is_pr_already_exists_error(already_exists)
+    assert images_streams.is_pr_already_exists_error(GithubException(422, {'errors': ['PR already exists']}))
+    assert not images_streams.is_pr_already_exists_error(
+        GithubException(422, {'message': 'Validation Failed', 'errors': [{'code': 'invalid', 'field': 'base'}]})
+    )
+    assert not images_streams.is_pr_already_exists_error(GithubException(500, None))
+
+
+# Tests for extract_parent_digest
+
+
+def test_extract_parent_digest_from_content():
+    """Test that parent images are extracted from FROM lines, with top-level ARGs substituted"""
+    dockerfile = (
+        'ARG BASE=registry.ci.openshift.org/ocp/4.17:base\n'
+        'FROM --platform=linux/amd64 \\\n'
+        '    registry.ci.openshift.org/ocp/builder:golang-1.21 AS builder\n'
+        'ARG BASE=ignored\n'
+        'RUN echo hello \\\n'
+        '    from continuation\n'
+        'FROM ${BASE}'
+    )
+
+    digest, parents = images_streams.extract_parent_digest_from_content(dockerfile)
+
+    assert parents == [
+        'registry.ci.openshift.org/ocp/builder:golang-1.21',
+        'registry.ci.openshift.org/ocp/4.17:base',
+    ]
+    assert digest == images_streams.calc_parent_digest(parents)
+
+
+# Tests for rewrite_parent_images
+
+
+def test_rewrite_parent_images():
+    """Test that FROM images are replaced in order, preserving flags, stage names and other lines"""
+    dockerfile = (
+        'FROM --platform=linux/amd64 registry.ci.openshift.org/ocp/builder:golang-1.20 AS builder\n'
+        'RUN echo hello \\\n'
+        '    from continuation\n'
+        'from registry.ci.openshift.org/ocp/4.16:base\n'
+        'COPY --from=builder /bin/app /bin/app\n'
+    )
+
+    result = images_streams.rewrite_parent_images(
+        dockerfile,
+        ['registry.ci.openshift.org/ocp/builder:golang-1.21', 'registry.ci.openshift.org/ocp/4.17:base'],
+    )
+
+    assert result == (
+        'FROM --platform=linux/amd64 registry.ci.openshift.org/ocp/builder:golang-1.21 AS builder\n'
+        'RUN echo hello \\\n'
+        '    from continuation\n'
+        'from registry.ci.openshift.org/ocp/4.17:base\n'
+        'COPY --from=builder /bin/app /bin/app\n'
+    )
+
+
+def test_rewrite_parent_images_cardinality_mismatch():
+    """Test that a different number of FROMs and parent images is rejected"""
+    with pytest.raises(ValueError, match='2 FROM instructions but 1 parent images'):
+        images_streams.rewrite_parent_images('FROM a AS builder\nFROM b\n', ['c'])
+
+
+def test_rewrite_parent_images_continuation_line():
+    """Test that a FROM whose image is on a continuation line is rewritten through the parser"""
+    dockerfile = 'FROM \\\n  a\nRUN x\n'
+    assert images_streams.rewrite_parent_images(dockerfile, ['N0']) == 'FROM N0\nRUN x\n'
+
+    with pytest.raises(ValueError, match='1 FROM instructions but 2 parent images'):
+        images_streams.rewrite_parent_images(dockerfile, ['N0', 'N1'])
+
+
 # Tests for images:streams gen-buildconfigs command
 
 
@@ -367,6 +632,72 @@ def test_gen_buildconfigs_uses_get_upstreaming_entries():
     assert 'config.upstream_image_base' in source
 
 
+def _gen_buildconfigs_dockerfiles(mocker, mock_runtime, tmp_path, entries):
+    """Runs gen-buildconfigs for the given upstreaming entries and returns the rendered Dockerfile of each buildconfig"""
+    mock_runtime.group_config.name = 'openshift-4.17'
+    mock_runtime.data_dir = str(tmp_path)  # no ci_transforms overrides, so the bundled templates are used
+    mock_runtime.repos = {}
+    mock_runtime.assert_mutation_is_permitted = mocker.Mock()
+    mocker.patch.object(images_streams, '_get_upstreaming_entries', return_value=entries)
+    output = tmp_path / 'buildconfigs.yaml'
+
+    images_streams.images_streams_gen_buildconfigs.callback.__wrapped__(
+        mock_runtime,
+        streams=tuple(entries),
+        images=(),
+        output=str(output),
+        as_user=None,
+        apply=False,
+        live_test_mode=False,
+    )
+
+    buildconfigs = list(images_streams.yaml.safe_load_all(output.read_text()))
+    return [bc['spec']['source']['dockerfile'] for bc in buildconfigs]
+
+
+def test_gen_buildconfigs_rhel_9_golang_dockerfile(mocker, mock_runtime, tmp_path):
+    entries = {
+        'rhel-9-golang': Model(
+            {
+                'transform': 'rhel-9/golang',
+                'upstream_image_base': 'registry.ci.openshift.org/ocp-private/builder-base:rhel-9-golang-1.22-openshift-4.17.art',
+                'upstream_image': 'registry.ci.openshift.org/ocp/builder:rhel-9-golang-1.22-openshift-4.17',
+            }
+        ),
+    }
+    dockerfiles = _gen_buildconfigs_dockerfiles(mocker, mock_runtime, tmp_path, entries)
+
+    with open(images_streams.bundled_transform_templates['rhel-9/golang'], encoding='utf-8') as f:
+        template = f.read()
+    assert dockerfiles == [
+        template.rstrip('\n')
+        + '\n'
+        + 'ENV OPENSHIFT_CI=true\n'
+        + 'LABEL io.k8s.display-name=builder-rhel-9-golang-1.22-openshift-4.17\n'
+        + "LABEL io.k8s.description='ART equivalent image openshift-4.17-rhel-9-golang - rhel-9/golang'\n"
+        + 'USER 0\n'
+        + 'RUN rm -rf /etc/yum.repos.d/*.repo && curl http://base-4-17-rhel9.ocp.svc > /etc/yum.repos.d/ci-rpm-mirrors.repo\n'
+        + 'RUN yum config-manager --setopt=skip_if_unavailable=True --save\n'
+    ]
+
+
+def test_gen_buildconfigs_keeps_template_openshift_ci_env(mocker, mock_runtime, tmp_path):
+    """The rhel-7 templates already set OPENSHIFT_CI=true; it must not be repeated"""
+    entries = {
+        'rhel-7-golang': Model(
+            {
+                'transform': 'rhel-7/golang',
+                'upstream_image_base': 'registry.ci.openshift.org/ocp-private/builder-base:rhel-7-golang-openshift-4.17.art',
+                'upstream_image': 'registry.ci.openshift.org/ocp/builder:rhel-7-golang-openshift-4.17',
+            }
+        ),
+    }
+    dockerfile = _gen_buildconfigs_dockerfiles(mocker, mock_runtime, tmp_path, entries)[0]
+
+    assert dockerfile.count('OPENSHIFT_CI=true') == 1
+    assert 'LABEL io.k8s.display-name=builder-rhel-7-golang-openshift-4.17\n' in dockerfile
+
+
 # Tests for master version comparison in images_streams_prs
 
 
@@ -417,3 +748,225 @@ def test_master_version_comparison(target, master, expect_ahead):
     # This is the exact comparison from images_streams.py:1170
     target_is_ahead = (major, minor) > (master_major, master_minor)
     assert target_is_ahead == expect_ahead
+
+
+# Tests for images:streams prs reconciliation
+
+
+STREAMS_PRS_DESIRED_FROM = 'registry.ci.openshift.org/ocp/builder:rhel-9-golang-1.22-openshift-4.17'
+STREAMS_PRS_UPSTREAM_DOCKERFILE = 'FROM registry.ci.openshift.org/ocp/builder:rhel-9-golang-1.21-openshift-4.17\n'
+
+
+class _FakeClock:
+    """Stands in for time.monotonic() and time.sleep(); sleeping advances the clock instead of blocking"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def _streams_prs_image(mocker, dgk, parent=None, merge_first=False):
+    image_meta = mocker.MagicMock()
+    image_meta.distgit_key = dgk
+    image_meta.config = Model(
+        {
+            'from': {'stream': 'golang'},
+            'content': {
+                'source': {
+                    'ci_alignment': {
+                        'streams_prs': {'from': [STREAMS_PRS_DESIRED_FROM], 'merge_first': merge_first},
+                    },
+                },
+            },
+        }
+    )
+    image_meta.config_filename = f'{dgk}.yml'
+    image_meta.get_component_name.return_value = dgk
+    image_meta.resolve_parent.return_value = parent
+    return image_meta
+
+
+@pytest.fixture
+def streams_prs(mocker, tmp_path):
+    """
+    Runs images:streams prs against mocked GitHub and git. The upstream repository of each image is
+    openshift/<distgit_key>; its Dockerfile is STREAMS_PRS_UPSTREAM_DOCKERFILE unless a test changes it.
+    """
+    runtime = mocker.MagicMock()
+    runtime.group = 'openshift-4.17'
+    runtime.group_config = Model(
+        {'name': 'openshift-4.17', 'vars': {'MAJOR': 4, 'MINOR': 17}, 'public_upstreams': []},
+    )
+    runtime.gitdata.origin_url = 'https://github.com/openshift-eng/ocp-build-data'
+    runtime.gitdata.commit_hash = 'abcdef'
+    runtime.working_dir = str(tmp_path)
+    runtime.git_cache_dir = None
+
+    clock = _FakeClock()
+    created = []  # (time, distgit_key, body) of each PR opened
+
+    github = mocker.patch('github.Github').return_value
+    github.get_user.return_value.login = 'openshift-bot'
+    repos = {}
+
+    def get_repo(full_name):
+        if full_name not in repos:
+            org, name = full_name.split('/')
+            repo = mocker.MagicMock()
+            repo.full_name = full_name
+            repo.html_url = f'https://github.com/{full_name}'
+            repo.git_url = f'https://github.com/{full_name}.git'
+            repo.get_contents.return_value.decoded_content = STREAMS_PRS_UPSTREAM_DOCKERFILE.encode('utf-8')
+            repo.get_pulls.return_value = []
+            repo.get_branch.side_effect = UnknownObjectException(404)
+
+            def create_pull(title, body, base, head, draft, name=name):
+                created.append((clock.monotonic(), name, body))
+                return mocker.MagicMock(html_url=f'https://github.com/{full_name}/pull/1')
+
+            repo.create_pull.side_effect = create_pull
+            repos[full_name] = repo
+        return repos[full_name]
+
+    github.get_repo.side_effect = get_repo
+
+    def clone(source_repo_url, clone_dir, gitargs, git_cache_dir):
+        os.makedirs(clone_dir)
+        with open(os.path.join(clone_dir, 'Dockerfile'), mode='w', encoding='utf-8') as f:
+            f.write(
+                get_repo(f'openshift/{os.path.basename(clone_dir)}').get_contents.return_value.decoded_content.decode()
+            )
+
+    git_clone = mocker.patch.object(images_streams, 'git_clone', side_effect=clone)
+    mocker.patch.object(images_streams.exectools, 'cmd_assert', return_value=('', ''))
+    mocker.patch.object(images_streams, 'get_github_git_auth_env', return_value={})
+    mocker.patch.object(images_streams, 'build_git_auth_env', return_value={})
+    mocker.patch.object(images_streams, 'what_is_in_master', return_value='4.18')
+    upstream_source = mocker.patch.object(
+        images_streams,
+        '_get_upstream_source',
+        side_effect=lambda runtime, image_meta: (
+            f'https://github.com/openshift-priv/{image_meta.distgit_key}',
+            'release-4.17',
+        ),
+    )
+    mocker.patch.object(
+        images_streams.SourceResolver,
+        'get_public_upstream',
+        side_effect=lambda url, public_upstreams: (url.replace('openshift-priv', 'openshift'), None, False),
+    )
+    mocker.patch.object(images_streams, 'time', clock)
+    mocker.patch.object(images_streams.jenkins, 'get_build_url', return_value=None)
+    mocker.patch.object(images_streams, 'reconcile_jira_issues')
+
+    def run(image_metas, interstitial=120):
+        """Returns the exit code of the command, or None if it did not exit"""
+        runtime.ordered_image_metas.return_value = image_metas
+        try:
+            images_streams.images_streams_prs.callback.__wrapped__(
+                runtime,
+                github_access_token='token',
+                bug=None,
+                interstitial=interstitial,
+                ignore_ci_master=False,
+                force_merge=False,
+                ignore_missing_images=False,
+                draft_prs=False,
+                dry_run=False,
+                moist_run=False,
+                add_auto_labels=False,
+                add_label=(),
+            )
+        except SystemExit as e:
+            return e.code
+        return None
+
+    return SimpleNamespace(
+        run=run, get_repo=get_repo, created=created, git_clone=git_clone, upstream_source=upstream_source
+    )
+
+
+def test_images_streams_prs_child_notes_parent_pr(mocker, streams_prs):
+    parent = _streams_prs_image(mocker, 'parent')
+    child = _streams_prs_image(mocker, 'child', parent=parent)
+    other = _streams_prs_image(mocker, 'other')
+
+    assert streams_prs.run([parent, child, other]) is None
+
+    bodies = {name: body for _, name, body in streams_prs.created}
+    assert sorted(bodies) == ['child', 'other', 'parent']
+    assert 'Depends on https://github.com/openshift/parent/pull/1 .' in bodies['child']
+    assert 'Depends on' not in bodies['parent']
+    assert 'Depends on' not in bodies['other']
+
+
+def test_images_streams_prs_merge_first_parent_skips_descendants(mocker, streams_prs):
+    parent = _streams_prs_image(mocker, 'parent', merge_first=True)
+    child = _streams_prs_image(mocker, 'child', parent=parent)
+    grandchild = _streams_prs_image(mocker, 'grandchild', parent=child)
+
+    # The child waits for the parent's PR and skips itself; the grandchild inherits that skip
+    assert streams_prs.run([parent, child, grandchild]) == 25
+    assert [name for _, name, _ in streams_prs.created] == ['parent']
+
+
+def test_images_streams_prs_failed_parent_releases_children(mocker, streams_prs):
+    parent = _streams_prs_image(mocker, 'parent')
+    child = _streams_prs_image(mocker, 'child', parent=parent)
+
+    def get_upstream_source(runtime, image_meta):
+        if image_meta is parent:
+            raise IOError('unable to resolve source')
+        return f'https://github.com/openshift-priv/{image_meta.distgit_key}', 'release-4.17'
+
+    streams_prs.upstream_source.side_effect = get_upstream_source
+
+    # The child is not left waiting for its parent; the parent's failure is reported at the end
+    assert streams_prs.run([parent, child]) == 50
+    assert [(name, 'Depends on' in body) for _, name, body in streams_prs.created] == [('child', False)]
+
+
+def test_images_streams_prs_spaces_pr_creation(mocker, streams_prs):
+    image_metas = [_streams_prs_image(mocker, f'image-{i}') for i in range(12)]
+
+    assert streams_prs.run(image_metas, interstitial=120) is None
+
+    times = sorted(t for t, _, _ in streams_prs.created)
+    assert len(times) == 12
+    assert all(later - earlier >= 120 for earlier, later in zip(times, times[1:]))
+
+
+def test_images_streams_prs_aligned_upstream_is_not_cloned(mocker, streams_prs):
+    public_repo = streams_prs.get_repo('openshift/app')
+    public_repo.get_contents.return_value.decoded_content = f'FROM {STREAMS_PRS_DESIRED_FROM}\n'.encode('utf-8')
+    # A reconciliation branch and PR remain from an earlier run
+    streams_prs.get_repo('openshift-bot/app').get_branch.side_effect = None
+    stale_pr = mocker.MagicMock(html_url='https://github.com/openshift/app/pull/1')
+    stale_pr.head.ref = 'art-consistency-openshift-4.17-app'
+    stale_pr.head.user.login = 'openshift-bot'
+    public_repo.get_pulls.return_value = [stale_pr]
+
+    assert streams_prs.run([_streams_prs_image(mocker, 'app')]) is None
+
+    public_repo.get_contents.assert_called_once_with('Dockerfile', ref='release-4.17')
+    streams_prs.git_clone.assert_not_called()
+    stale_pr.edit.assert_called_once_with(state='closed')
+    public_repo.create_pull.assert_not_called()
+
+
+def test_images_streams_prs_contents_api_error_falls_back_to_clone(mocker, streams_prs):
+    public_repo = streams_prs.get_repo('openshift/app')
+    public_repo.get_contents.side_effect = GithubException(502, data={'message': 'Server Error'})
+
+    assert streams_prs.run([_streams_prs_image(mocker, 'app')]) is None
+
+    streams_prs.git_clone.assert_called_once()
+    assert [name for _, name, _ in streams_prs.created] == ['app']
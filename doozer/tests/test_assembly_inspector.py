@@ -102,4 +102,19 @@ class TestAssemblyInspector(IsolatedAsyncioTestCase):
         ]
         self.assertFalse(ai._is_installed_rpm_in_tag(installed_rpm, "my-candidate-tag"))
 
+    def test_check_group_rpm_package_consistency(self):
+        built = MagicMock(distgit_key="built", config=Model({}))
+        built.determine_rhel_targets.return_value = [9]
+        unbuilt = MagicMock(distgit_key="unbuilt", config=Model({}))
+        unbuilt.determine_rhel_targets.return_value = [9]
+        rt = MagicMock(mode="both", group_config=Model({}))
+        rt.rpm_metas.return_value = [built, unbuilt]
+        ai = AssemblyInspector(rt, MagicMock())
+        ai._rpm_build_cache = {9: {"built": {"nvr": "built-1.0-1.el9"}, "unbuilt": None}}
+
+        # Only the requested RPM is evaluated
+        self.assertEqual(ai.check_group_rpm_package_consistency(built), [])
+        issues = ai.check_group_rpm_package_consistency(unbuilt)
+        self.assertEqual([(i.component, i.msg) for i in issues], [("unbuilt", "Did not find rhel-9 build for unbuilt")])
+
     pass
@@ -501,7 +501,7 @@ class BuildSyncPipeline:
         if self.publish:
             # Run 'oc adm release new' in parallel
             tasks = []
-            for filename in glob.glob(f'{GEN_PAYLOAD_ARTIFACTS_OUT_DIR}/updated-tags-for.*.yaml'):
+            for filename in glob.glob(f'{GEN_PAYLOAD_ARTIFACTS_OUT_DIR}/updated-tags-for.*.json'):
                 tasks.append(self._publish(filename))
             await asyncio.gather(*tasks)
 
@@ -514,7 +514,7 @@ class BuildSyncPipeline:
         current_span.set_attribute("build-sync.filename", filename)
 
         with open(filename) as f:
-            meta = yaml.safe_load(f.read())['metadata']
+            meta = json.load(f)['metadata']
             namespace = meta['namespace']
             reponame = namespace.replace('ocp', 'release')
             name = f'{self.version}.0-{self.assembly}'  # must be semver